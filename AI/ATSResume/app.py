@@ -1,10 +1,18 @@
 from dotenv import load_dotenv
+import asyncio
+import io
+import subprocess
 import streamlit as st
 from langchain_groq import ChatGroq
 import os
 import PyPDF2 as pdf
 from langchain_core.prompts import PromptTemplate
 from langchain_community.document_loaders import WebBaseLoader
+from pipeline import Stage, run_pipeline
+from job_cache import JobSummaryCache
+from resume_digest import DIGEST_TEMPLATE, ResumeDigestCache
+from ats_score import score_resume
+from bulk_rank import MAX_RESUMES, iter_zip_resumes, limit_resumes, parse_resumes_subprocess, rank_resumes
 GROQ_API_KEY1=st.secrets['GROQ_API_KEY1']
 GROQ_API_KEY2=st.secrets['GROQ_API_KEY2']
 GROQ_API_KEY3=st.secrets['GROQ_API_KEY3']
@@ -13,12 +21,18 @@ GROQ_API_KEY3=st.secrets['GROQ_API_KEY3']
 load_dotenv()
 
 
-def get_response(resume_content, job_content):
-    llm = ChatGroq(
+@st.cache_resource
+def get_llm(api_key, temperature=0.5):
+    """One Groq client per key and temperature, shared across reruns."""
+    return ChatGroq(
         model_name="llama-3.3-70b-versatile",
-        temperature=0.5,
-        groq_api_key=GROQ_API_KEY1
+        temperature=temperature,
+        groq_api_key=api_key
     )
+
+
+async def get_response(resume_content, job_content, match):
+    llm = get_llm(GROQ_API_KEY1)
     prompt_extract = PromptTemplate.from_template(
         """
         ###Role Definition:
@@ -31,9 +45,16 @@ def get_response(resume_content, job_content):
             web-scraped from the provided job link. The aim is to assist candidates in optimizing their resumes for a 
             competitive job market by identifying gaps and offering targeted improvement suggestions.    
 
+        ###Keyword Match (computed locally, do not recalculate):
+            Match percentage: {match_score}%
+            Matched keywords: {matched_keywords}
+            Missing keywords: {missing_keywords}
+            Use this exact match percentage, explain it in the reasons section, and build the
+            missing keywords section from the missing keywords above.
+
         ###Response Format (Use HTML with CSS styling):
             <div style='text-align: center; padding: 20px;'>
-                <h1 style='font-size: 48px; color: white; margin-bottom: 10px;'>Match Percentage: [Insert calculated percentage]%</h1>
+                <h1 style='font-size: 48px; color: white; margin-bottom: 10px;'>Match Percentage: {match_score}%</h1>
             </div>
 
             <div style='background-image: linear-gradient(to top, #1e3c72 0%, #1e3c72 1%, #2a5298 100%); padding: 20px; margin: 10px 0; border-radius: 10px;'>
@@ -61,41 +82,73 @@ def get_response(resume_content, job_content):
                 [Coursera and Udemy certification recommendations with links]
             </div>
 
-        Resume Content: {resume_content}
+        Resume (JSON digest, or the raw text when no digest is available): {resume_content}
         Content scraped from Job Application Link: {job_content}
         """
     )
     chain = prompt_extract | llm
-    res = chain.invoke(input={'resume_content': resume_content, 'job_content': job_content})
+    res = await chain.ainvoke(input={
+        'resume_content': resume_content,
+        'job_content': job_content,
+        'match_score': match.score,
+        'matched_keywords': ", ".join(match.matched) or "none",
+        'missing_keywords': ", ".join(match.missing) or "none",
+    })
     return res.content
 
 
 def extract_text(uploaded_file):
-    try:
-        reader = pdf.PdfReader(uploaded_file)
-        pages = len(reader.pages)
-        text = ""
-        for page_num in range(pages):
-            page = reader.pages[page_num]
-            text += str(page.extract_text())
-        return text
-    except Exception as e:
-        st.error(f"Error occurred while extracting text: {str(e)}")
-        return ""
-
-
-def scrape_website(job_link):
-    if not job_link:
-        return "Please provide a valid job link."
-
-    llm_scrape = ChatGroq(
-        model_name="llama-3.3-70b-versatile",
-        temperature=0.5,
-        groq_api_key=GROQ_API_KEY2
-    )
+    reader = pdf.PdfReader(uploaded_file)
+    pages = len(reader.pages)
+    text = ""
+    for page_num in range(pages):
+        page = reader.pages[page_num]
+        text += str(page.extract_text())
+    return text
+
+
+@st.cache_resource
+def get_job_cache():
+    """Condensed job descriptions persist across sessions; see job_cache.py."""
+    return JobSummaryCache()
+
+
+@st.cache_resource
+def get_digest_cache():
+    """Resume digests persist across sessions; see resume_digest.py."""
+    return ResumeDigestCache()
+
+
+async def read_resume(uploaded_file):
+    """PDF parsing is CPU-bound, so it runs on a worker thread."""
+    return await asyncio.to_thread(extract_text, io.BytesIO(uploaded_file.getvalue()))
 
+
+async def extract_digest(resume_text):
+    chain = PromptTemplate.from_template(DIGEST_TEMPLATE) | get_llm(GROQ_API_KEY1, temperature=0)
+    res = await chain.ainvoke(input={'resume_text': resume_text})
+    return res.content
+
+
+async def digest_resume(uploaded_file, resume_text):
+    """Structured resume digest, extracted only for PDFs not seen before."""
+    return await get_digest_cache().digest(uploaded_file.getvalue(), resume_text, extract_digest)
+
+
+async def score_match(resume_text, job_content):
+    """Deterministic keyword match; takes milliseconds, so it runs inline."""
+    return score_resume(resume_text, job_content)
+
+
+async def fetch_job_page(job_link):
     loader = WebBaseLoader(job_link)
-    page_data = loader.load().pop().page_content
+    documents = await asyncio.to_thread(loader.load)
+    return documents.pop().page_content
+
+
+async def scrape_website(page_data):
+    llm_scrape = get_llm(GROQ_API_KEY2)
+
     prompt_job_content = PromptTemplate.from_template(
         """
            ### SCRAPED TEXT FROM WEBSITE:
@@ -112,26 +165,27 @@ def scrape_website(job_link):
     )
 
     chain_extract = prompt_job_content | llm_scrape
-    res = chain_extract.invoke(input={'page_data': page_data})
+    res = await chain_extract.ainvoke(input={'page_data': page_data})
     return res.content
 
 
-def generate_mail(resume_content, job_content):
+async def summarize_job(job_link):
+    """Condensed job posting, fetched and summarized only when the cache can't answer."""
+    return await get_job_cache().summarize(job_link, fetch_job_page, scrape_website)
+
+
+async def generate_mail(resume_content, job_content):
     if not resume_content or not job_content:
         return "Resume or job content is missing."
 
-    llm_mail = ChatGroq(
-        model_name="llama-3.3-70b-versatile",
-        temperature=0.5,
-        groq_api_key=GROQ_API_KEY3
-    )
+    llm_mail = get_llm(GROQ_API_KEY3)
 
     prompt_mail = PromptTemplate.from_template(
         """
             ### JOB CONTENT:
             {job_content}
 
-            ### USER RESUME:
+            ### USER RESUME (JSON DIGEST OR RAW TEXT):
             {resume_content}
 
             ### INSTRUCTION:
@@ -149,10 +203,151 @@ def generate_mail(resume_content, job_content):
     )
 
     mail_extract = prompt_mail | llm_mail
-    final_mail = mail_extract.invoke(input={'job_content': job_content, 'resume_content': resume_content})
+    final_mail = await mail_extract.ainvoke(input={'job_content': job_content, 'resume_content': resume_content})
     return final_mail.content
 
 
+# The resume digest and the job summary are extracted in parallel and feed
+# both LLM outputs, while the report and the mail are independent of each
+# other: the critical path is two LLM calls, or one when the resume and the
+# job link are already cached. The local match score is ready as soon as the
+# job summary is.
+ANALYSIS_STAGES = [
+    Stage("text", read_resume, ["upload"]),
+    Stage("resume", digest_resume, ["upload", "text"]),
+    Stage("job", summarize_job, ["link"]),
+    Stage("score", score_match, ["text", "job"]),
+    Stage("report", get_response, ["resume", "job", "score"]),
+    Stage("mail", generate_mail, ["resume", "job"]),
+]
+
+STAGE_ERRORS = {
+    "text": "Error occurred while extracting text",
+    "resume": "Could not summarize the resume",
+    "score": "Could not score the resume",
+    "job": "Could not load or summarize the job posting",
+    "report": "Could not generate the ATS report",
+    "mail": "Could not generate the email",
+}
+
+
+def render_score(slot, match):
+    with slot.container():
+        st.metric("Keyword match", f"{match.score:.0f}%",
+                  help="Weighted share of the job's skills and keywords found in your resume")
+        if match.missing:
+            st.markdown("**Missing keywords:** " + ", ".join(f"`{keyword}`" for keyword in match.missing))
+
+
+def render_mail(slot, email):
+    with slot.container():
+        st.markdown("""
+            <div style='background-color: #f5f5f5; padding: 20px; margin: 20px 0; border-radius: 10px;'>
+                <h2 style='color: #333; border-bottom: 2px solid #0066cc;'>📝 Generated Job Application Email</h2>
+            </div>
+        """, unsafe_allow_html=True)
+        st.text_area("Email Content", email, height=600, max_chars=None)
+
+
+def analyze(uploaded_file, job_link):
+    """Run the analysis stages concurrently, drawing the report and the mail as each finishes."""
+    score_slot, report_slot, mail_slot = st.empty(), st.empty(), st.empty()
+
+    def on_done(name, result):
+        if name == "score":
+            render_score(score_slot, result)
+        elif name == "report":
+            report_slot.markdown(result, unsafe_allow_html=True)
+        elif name == "mail":
+            render_mail(mail_slot, result)
+
+    def on_error(name, error):
+        st.error(f"{STAGE_ERRORS[name]}: {str(error)}")
+
+    inputs = {"upload": uploaded_file, "link": job_link}
+    return asyncio.run(run_pipeline(ANALYSIS_STAGES, inputs, on_done, on_error))
+
+
+async def deep_dive(data, resume_text, job_content):
+    """Digest and full ATS report for one candidate."""
+    digest = await get_digest_cache().digest(data, resume_text, extract_digest)
+    return await get_response(digest, job_content, score_resume(resume_text, job_content))
+
+
+async def run_deep_dives(candidates, job_content, slots, limit=3):
+    """Reports for ``candidates`` (name, data, text), at most ``limit`` at a time, drawn as each finishes."""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(name, data, resume_text):
+        async with semaphore:
+            try:
+                slots[name].markdown(await deep_dive(data, resume_text, job_content), unsafe_allow_html=True)
+            except Exception as e:
+                slots[name].error(f"Could not generate the ATS report: {str(e)}")
+
+    await asyncio.gather(*(run(*candidate) for candidate in candidates))
+
+
+def render_bulk_mode():
+    """Rank many resumes against one job locally; only the top few get LLM reports."""
+    st.markdown("### 📚 Rank Resumes Against One Job")
+    source = st.radio("Resumes", ["Zip archive or PDFs", "Folder"], horizontal=True)
+    if source == "Folder":
+        uploads = st.file_uploader("Resume folder", type="pdf", accept_multiple_files="directory")
+    else:
+        uploads = st.file_uploader("Resumes", type=["zip", "pdf"], accept_multiple_files=True)
+    bulk_job_link = st.text_input("Job Link", placeholder="Paste the job application link here...")
+    job_content = st.text_area("...or paste the job description", height=150)
+    top_n = st.slider("Detailed AI reports for the top", min_value=0, max_value=10, value=3)
+    if not st.button("Rank Resumes 🚀"):
+        return
+    if not uploads or not (bulk_job_link or job_content):
+        st.error("Please upload resumes and provide a job link or description.")
+        return
+
+    if not job_content:
+        try:
+            with st.spinner("Reading the job posting..."):
+                job_content = asyncio.run(summarize_job(bulk_job_link.strip()))
+        except Exception as e:
+            st.error(f"{STAGE_ERRORS['job']}: {str(e)}")
+            return
+
+    items = []
+    for upload in uploads:
+        if upload.name.lower().endswith(".zip"):
+            items.extend(iter_zip_resumes(upload.getvalue()))
+        else:
+            items.append((upload.name, upload.getvalue()))
+    items, skipped = limit_resumes(items)
+    if skipped:
+        st.warning(f"Only the first {MAX_RESUMES} resumes are ranked; {skipped} more were skipped.")
+    try:
+        # PDF parsing runs in a separate process pool; see bulk_rank.py.
+        with st.spinner(f"Reading {len(items)} resumes..."):
+            names, blobs, texts, errors = parse_resumes_subprocess(items)
+    except (subprocess.CalledProcessError, OSError) as e:
+        st.error(f"Could not read the resumes: {getattr(e, 'stderr', None) or str(e)}")
+        return
+    table, skills = rank_resumes(names, texts, job_content, errors)
+
+    st.dataframe(table, hide_index=True, column_config={
+        "Score": st.column_config.ProgressColumn("Score", min_value=0, max_value=100, format="%.1f"),
+        **{skill: st.column_config.CheckboxColumn(skill) for skill in skills},
+    })
+    st.download_button("Download Ranking", table.to_csv(index=False), "resume_ranking.csv", "text/csv",
+                       on_click="ignore")
+
+    documents = {name: (data, text) for name, data, text in zip(names, blobs, texts)}
+    top = [name for name, error in zip(table["Resume"], table["Error"]) if not error][:top_n]
+    slots = {}
+    for rank, name in enumerate(top, start=1):
+        with st.expander(f"#{rank} {name}", expanded=rank == 1):
+            slots[name] = st.empty()
+            slots[name].caption("Writing report...")
+    asyncio.run(run_deep_dives([(name, *documents[name]) for name in top], job_content, slots))
+
+
 st.set_page_config(
     page_title="Smart ATS Resume Analyzer",
     page_icon="📄",
@@ -318,7 +513,9 @@ st.markdown("""
     </div>
 """, unsafe_allow_html=True)
 
-
+if st.sidebar.toggle("Recruiter bulk mode", help="Rank a zip or folder of resumes against one job"):
+    render_bulk_mode()
+    st.stop()
 
 col1, col2 = st.columns(2)
 
@@ -345,21 +542,7 @@ with col2:
 if submit:
     if uploaded_file is not None and job_link:
         with st.spinner('Analyzing your resume... Please wait'):
-            resume_content = extract_text(uploaded_file)
-            job_content = scrape_website(job_link)
-            response = get_response(resume_content, job_content)
-
-            # Display formatted response
-            st.markdown(response, unsafe_allow_html=True)
-
-            # Generate and display email separately
-            email = generate_mail(resume_content, job_content)
-            st.markdown("""
-                <div style='background-color: #f5f5f5; padding: 20px; margin: 20px 0; border-radius: 10px;'>
-                    <h2 style='color: #333; border-bottom: 2px solid #0066cc;'>📝 Generated Job Application Email</h2>
-                </div>
-            """, unsafe_allow_html=True)
-            st.text_area("Email Content", email, height=600, max_chars=None)
+            analyze(uploaded_file, job_link)
     else:
         st.error("Please upload both a resume and provide a job link.")
 
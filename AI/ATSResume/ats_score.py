@@ -0,0 +1,248 @@
+"""Local, deterministic ATS match scoring.
+
+The job text is reduced to weighted keywords: every known skill it mentions
+plus the content words it repeats. Synonyms and spellings are folded to one
+canonical form first ("JS", "Java Script" -> javascript; "k8s" ->
+kubernetes; "ML" -> machine learning), and multi-word skills become single
+terms so "machine learning" never half-matches "learning". Only true
+spellings are folded, and skills that double as everyday words ("React",
+"Excel") only count when written as names. Each keyword is weighted by a
+BM25-style term-frequency saturation of how often the job repeats it (there
+is no IDF term: one job is not a corpus), with known skills counting
+double. A resume's score is the weighted share of those keywords it
+contains, so the same resume and job always give the same number, in about
+a millisecond, along with the missing keywords ordered by weight.
+
+:meth:`JobKeywords.coverage` scores many resumes in one NumPy pass for bulk
+ranking.
+"""
+import re
+from collections import Counter, namedtuple
+
+import numpy as np
+
+# canonical skill -> other spellings of the same skill. Canonical names are
+# matched as well. Related but different skills (git vs version control,
+# scrum vs agile) stay separate, and so do abbreviations that are also
+# ordinary words or other tools ("ts", "py", "tf").
+SYNONYMS = {
+    "javascript": ["js", "java script", "ecmascript", "es6"],
+    "typescript": [],
+    "node.js": ["node", "nodejs", "node js"],
+    "react": ["react.js", "reactjs", "react js"],
+    "angular": ["angular.js", "angularjs"],
+    "vue": ["vue.js", "vuejs"],
+    "next.js": ["nextjs"],
+    "express": ["express.js", "expressjs"],
+    "python": ["python3"],
+    "golang": ["go lang"],
+    "c++": ["cpp"],
+    "c#": ["c sharp", "csharp"],
+    ".net": ["dotnet", "dot net"],
+    "asp.net": [],
+    "postgresql": ["postgres", "psql"],
+    "mysql": ["my sql"],
+    "mongodb": ["mongo"],
+    "sql server": ["mssql", "ms sql"],
+    "nosql": ["no sql"],
+    "machine learning": ["ml"],
+    "deep learning": [],
+    "artificial intelligence": ["ai"],
+    "natural language processing": ["nlp"],
+    "computer vision": [],
+    "large language models": ["llm", "llms", "large language model"],
+    "generative ai": ["genai", "gen ai"],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "tensorflow": [],
+    "pytorch": [],
+    "pandas": [],
+    "numpy": [],
+    "kubernetes": ["k8s"],
+    "docker": [],
+    "amazon web services": ["aws"],
+    "google cloud": ["gcp", "google cloud platform"],
+    "microsoft azure": ["azure"],
+    "ci/cd": ["cicd", "ci cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "rest api": ["restful", "rest apis", "restful apis", "restful api"],
+    "graphql": [],
+    "microservices": ["micro services", "microservice"],
+    "object oriented programming": ["oop", "oops", "object oriented"],
+    "data structures": ["data structure", "dsa"],
+    "algorithms": ["algorithm"],
+    "unit testing": ["unit tests", "unit test"],
+    "pytest": [],
+    "junit": [],
+    "version control": ["source control"],
+    "git": [],
+    "github": [],
+    "gitlab": [],
+    "linux": [],
+    "unix": [],
+    "power bi": ["powerbi"],
+    "tableau": [],
+    "excel": ["ms excel", "microsoft excel"],
+    "data analysis": ["data analytics"],
+    "data visualization": ["data visualisation"],
+    "big data": [],
+    "apache spark": ["spark"],
+    "pyspark": [],
+    "hadoop": [],
+    "kafka": ["apache kafka"],
+    "airflow": ["apache airflow"],
+    "etl": [],
+    "statistics": ["statistical analysis"],
+    "html": ["html5"],
+    "css": ["css3"],
+    "tailwind": ["tailwind css", "tailwindcss"],
+    "java": [],
+    "spring boot": ["springboot"],
+    "kotlin": [],
+    "swift": [],
+    "flutter": [],
+    "react native": [],
+    "android": [],
+    "ios": [],
+    "django": [],
+    "flask": [],
+    "fastapi": ["fast api"],
+    "redis": [],
+    "agile": [],
+    "scrum": [],
+    "kanban": [],
+    "jira": [],
+    "communication": ["communication skills", "verbal communication", "written communication"],
+    "problem solving": [],
+    "leadership": [],
+    "teamwork": ["team work"],
+}
+
+# Spellings that are also everyday words ("react quickly", "excel at", "a
+# swift reply", "a network node") only count as the skill when written as a
+# name, capitalized or in capitals; in lower case they are dropped.
+NAME_ONLY = frozenset({"react", "express", "swift", "excel", "spark", "node"})
+
+STOP_WORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below between
+both but by can could did do does doing down during each etc few for from further had has have having he her here
+hers him his how i if in into is it its itself just like may me might more most must my no nor not now of off on
+once only or other our ours out over own per same shall she should so some such than that the their them then
+there these they this those through to too under until up upon very via was we well were what when where which
+while who whom why will with within without would you your yours
+ability able across applicant applicants apply benefits candidate candidates company competencies degree
+description details duties employer employment equal excellent experience experienced familiarity good great
+hands highly ideal including job join knowledge looking minimum new opportunity plus position preferred
+qualification qualifications related required requirements responsibilities role salary skill skills strong
+team title understanding using work working year years
+""".split())
+
+# A leading dot is kept for skill names such as ".net".
+TOKEN = re.compile(r"\.?[a-z0-9][a-z0-9+#./_\-]*[a-z0-9+#]|\.?[a-z0-9]")
+WORD_HYPHEN = re.compile(r"(?<=[a-zA-Z])-(?=[a-zA-Z])")
+# Known skills (canonical names) are counted twice as heavily as other words.
+SKILL_WEIGHT = 2.0
+K1 = 1.2
+
+ScoreResult = namedtuple("ScoreResult", ["score", "matched", "missing"])
+
+
+def _canonical_token(skill):
+    return skill.replace(" ", "_")
+
+
+def _display(term):
+    return term.replace("_", " ")
+
+
+def _build_phrase_pattern():
+    variants = {}
+    for canonical, spellings in SYNONYMS.items():
+        for spelling in [canonical] + spellings:
+            variants[spelling] = _canonical_token(canonical)
+    # Longest first, so "react native" wins over "react" and "node js" over "node".
+    alternatives = sorted(variants, key=len, reverse=True)
+    pattern = re.compile(r"(?<![\w.#+/-])(" + "|".join(map(re.escape, alternatives)) + r")(?![\w#+]|\.\w)",
+                         re.IGNORECASE)
+    return pattern, variants
+
+
+PHRASES, PHRASE_TOKENS = _build_phrase_pattern()
+SKILL_TOKENS = frozenset(PHRASE_TOKENS.values())
+
+
+def _stem(token):
+    """Fold simple plurals so "databases" matches "database"."""
+    if len(token) > 4 and token.endswith("s") and not token.endswith(("ss", "us", "is")) and "_" not in token:
+        return token[:-1]
+    return token
+
+
+def _fold_phrase(match):
+    spelling = match.group(1)
+    if spelling.islower() and spelling in NAME_ONLY:
+        return " "
+    return f" {PHRASE_TOKENS[spelling.lower()]} "
+
+
+def terms(text):
+    """Canonical terms of ``text``: folded skills plus stemmed content words."""
+    text = WORD_HYPHEN.sub(" ", text or "")
+    text = PHRASES.sub(_fold_phrase, text).lower()
+    result = []
+    for token in TOKEN.findall(text):
+        if token not in SKILL_TOKENS:
+            token = token.strip(".-/")
+        if token in SKILL_TOKENS:
+            result.append(token)
+        elif len(token) > 2 and token not in STOP_WORDS and not token.replace(".", "").isdigit():
+            result.append(_stem(token))
+    return result
+
+
+class JobKeywords:
+    """Weighted keywords of one job description."""
+
+    def __init__(self, job_text, max_other_terms=15):
+        counts = Counter(terms(job_text))
+        skills = [term for term in counts if term in SKILL_TOKENS]
+        # Ordinary words only count when the posting repeats them.
+        others = [term for term, count in counts.most_common() if term not in SKILL_TOKENS and count > 1]
+        self.keywords = skills + others[:max_other_terms]
+        tf = np.array([counts[term] for term in self.keywords], dtype=np.float64)
+        boost = np.array([SKILL_WEIGHT if term in SKILL_TOKENS else 1.0 for term in self.keywords])
+        self.weights = boost * tf * (K1 + 1) / (tf + K1)
+        self._index = {term: i for i, term in enumerate(self.keywords)}
+
+    def __len__(self):
+        return len(self.keywords)
+
+    @property
+    def skills(self):
+        return [_display(term) for term in self.keywords if term in SKILL_TOKENS]
+
+    def presence(self, resume_texts):
+        """``(n_resumes, n_keywords)`` boolean matrix of which keywords each resume mentions."""
+        matrix = np.zeros((len(resume_texts), len(self.keywords)), dtype=bool)
+        for row, text in enumerate(resume_texts):
+            hits = [self._index[term] for term in set(terms(text)) if term in self._index]
+            matrix[row, hits] = True
+        return matrix
+
+    def coverage(self, resume_texts):
+        """``(scores, presence)``: a 0-100 score per resume and its keyword presence matrix."""
+        presence = self.presence(resume_texts)
+        if not len(self):
+            return np.zeros(len(resume_texts)), presence
+        scores = presence @ self.weights / self.weights.sum() * 100
+        return np.round(scores, 1), presence
+
+    def score(self, resume_text):
+        """:class:`ScoreResult` for one resume; ``missing`` is ordered by weight, heaviest first."""
+        scores, presence = self.coverage([resume_text])
+        order = np.argsort(-self.weights, kind="stable")
+        matched = [_display(self.keywords[i]) for i in order if presence[0, i]]
+        missing = [_display(self.keywords[i]) for i in order if not presence[0, i]]
+        return ScoreResult(float(scores[0]), matched, missing)
+
+
+def score_resume(resume_text, job_text):
+    return JobKeywords(job_text).score(resume_text)
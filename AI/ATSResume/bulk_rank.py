@@ -0,0 +1,175 @@
+"""Rank a batch of resumes against one job description.
+
+PDF text extraction is the slow, CPU-bound part, so it is spread over a
+process pool. The Streamlit page can't host one (forking its threaded
+server is unsafe, and a spawned worker would re-run the page), so it calls
+:func:`parse_resumes_subprocess`, which runs the ``extract`` command below
+in a fresh Python process. The resumes are then scored against the job's
+weighted keywords in one NumPy pass (see ``ats_score.py``), giving a ranked
+table with a coverage column per skill the job asks for. Nothing here calls
+an LLM; the page reserves those for the top few candidates. From a shell::
+
+    python AI/ATSResume/bulk_rank.py rank job.txt resumes.zip -o ranked.csv
+"""
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from ats_score import SKILL_TOKENS, JobKeywords
+
+# Zip entries beyond these limits are skipped rather than inflated.
+MAX_PDF_BYTES = 20 * 1024 * 1024
+MAX_RESUMES = 2000
+
+
+def iter_zip_resumes(data):
+    """``(name, bytes)`` for every PDF in a zip archive, skipping macOS metadata."""
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        for info in archive.infolist():
+            name = info.filename
+            if info.is_dir() or not name.lower().endswith(".pdf") or "__MACOSX" in name:
+                continue
+            if os.path.basename(name).startswith(".") or info.file_size > MAX_PDF_BYTES:
+                continue
+            yield name, archive.read(info)
+
+
+def iter_folder_resumes(path):
+    """``(name, bytes)`` for every PDF under ``path``, relative to it."""
+    for root, _, files in os.walk(path):
+        for filename in sorted(files):
+            if filename.lower().endswith(".pdf") and not filename.startswith("."):
+                full_path = os.path.join(root, filename)
+                if os.path.getsize(full_path) <= MAX_PDF_BYTES:
+                    with open(full_path, "rb") as f:
+                        yield os.path.relpath(full_path, path), f.read()
+
+
+def extract_pdf_text(data):
+    """``(text, error)`` for one PDF; runs in a worker process."""
+    import PyPDF2 as pdf
+
+    try:
+        reader = pdf.PdfReader(io.BytesIO(data))
+        return "".join(str(page.extract_text()) for page in reader.pages), None
+    except Exception as e:
+        return "", str(e)
+
+
+def limit_resumes(items):
+    """``(items, skipped)``: the first ``MAX_RESUMES`` items and how many were left out."""
+    items = list(items)
+    return items[:MAX_RESUMES], max(0, len(items) - MAX_RESUMES)
+
+
+def parse_resumes(items, executor=None, workers=None):
+    """``(names, blobs, texts, errors)`` for ``(name, bytes)`` items, parsed in parallel."""
+    items = list(items)
+    names = [name for name, _ in items]
+    blobs = [data for _, data in items]
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(extract_pdf_text, blobs, chunksize=8))
+    else:
+        results = list(executor.map(extract_pdf_text, blobs, chunksize=8))
+    texts = [text for text, _ in results]
+    errors = [error for _, error in results]
+    return names, blobs, texts, errors
+
+
+def parse_resumes_subprocess(items, workers=None):
+    """:func:`parse_resumes` on a process pool owned by a child ``extract`` process.
+
+    Raises ``subprocess.CalledProcessError`` if the child fails.
+    """
+    items = list(items)
+    names = [name for name, _ in items]
+    blobs = [data for _, data in items]
+    with tempfile.TemporaryDirectory() as folder:
+        # Numbered files, so names from zips (paths, duplicates) can't collide.
+        for i, data in enumerate(blobs):
+            with open(os.path.join(folder, f"{i:05d}.pdf"), "wb") as f:
+                f.write(data)
+        command = [sys.executable, os.path.abspath(__file__), "extract", folder]
+        if workers:
+            command += ["--workers", str(workers)]
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    texts = [""] * len(items)
+    errors = [f"larger than {MAX_PDF_BYTES // (1024 * 1024)} MB"] * len(items)
+    for line in output.splitlines():
+        row = json.loads(line)
+        i = int(row["name"][:5])
+        texts[i], errors[i] = row["text"], row["error"]
+    return names, blobs, texts, errors
+
+
+def rank_resumes(names, texts, job_text, errors=None):
+    """Ranked DataFrame: rank, resume, score, skill counts, then one coverage column per job skill."""
+    keywords = JobKeywords(job_text)
+    scores, presence = keywords.coverage(texts)
+    skill_columns = [i for i, term in enumerate(keywords.keywords) if term in SKILL_TOKENS]
+    skills = [keywords.keywords[i].replace("_", " ") for i in skill_columns]
+
+    table = pd.DataFrame({"Resume": names, "Score": scores})
+    table["Skills Matched"] = presence[:, skill_columns].sum(axis=1)
+    table["Skills Missing"] = [", ".join(skill for skill, hit in zip(skills, row) if not hit)
+                               for row in presence[:, skill_columns]]
+    if errors is not None:
+        table["Error"] = [error or "" for error in errors]
+    coverage = pd.DataFrame(presence[:, skill_columns], columns=skills)
+    table = pd.concat([table, coverage], axis=1)
+    table = table.sort_values(["Score", "Resume"], ascending=[False, True], kind="stable").reset_index(drop=True)
+    table.insert(0, "Rank", range(1, len(table) + 1))
+    return table, skills
+
+
+def iter_resumes(path):
+    """``(name, bytes)`` for a zip archive or a folder of PDFs."""
+    if os.path.isdir(path):
+        return iter_folder_resumes(path)
+    with open(path, "rb") as f:
+        return list(iter_zip_resumes(f.read()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank resumes against a job description.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    rank_parser = subparsers.add_parser("rank", help="rank resumes against a job description")
+    rank_parser.add_argument("job", help="text file with the job description")
+    rank_parser.add_argument("resumes", help="zip archive or folder of PDF resumes")
+    rank_parser.add_argument("-o", "--output", help="write the ranking to this CSV (default: print the top 20)")
+    extract_parser = subparsers.add_parser("extract", help="print each PDF's text as JSON lines")
+    extract_parser.add_argument("resumes", help="zip archive or folder of PDF resumes")
+    for subparser in (rank_parser, extract_parser):
+        subparser.add_argument("--workers", type=int, default=None, help="parser processes (default: CPU count)")
+    args = parser.parse_args()
+
+    items, skipped = limit_resumes(iter_resumes(args.resumes))
+    if skipped:
+        print(f"Skipped {skipped} resumes beyond the first {MAX_RESUMES}", file=sys.stderr)
+    names, _, texts, errors = parse_resumes(items, workers=args.workers)
+    if args.command == "extract":
+        for name, text, error in zip(names, texts, errors):
+            print(json.dumps({"name": name, "text": text, "error": error}))
+        return
+
+    with open(args.job, encoding="utf-8") as f:
+        job_text = f.read()
+    table, _ = rank_resumes(names, texts, job_text, errors)
+    if args.output:
+        table.to_csv(args.output, index=False)
+        print(f"Ranked {len(table)} resumes into {args.output}")
+    else:
+        print(table[["Rank", "Resume", "Score", "Skills Matched", "Skills Missing"]].head(20).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
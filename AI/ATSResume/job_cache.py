@@ -0,0 +1,135 @@
+"""Persistent cache of condensed job descriptions, keyed by job link.
+
+Links are normalized first (scheme and host case, default ports, fragments,
+tracking parameters, query order), so the same posting shared in different
+ways maps to one entry. Each entry keeps the LLM summary together with a
+hash of the page text it came from:
+
+* a link checked within ``recheck_after`` is answered from the cache with no
+  fetch and no LLM call;
+* after that the page is fetched again, and the summary is reused as long
+  as the page text hashes the same; a changed page is summarized afresh;
+* summaries older than ``ttl`` are regenerated regardless, and the least
+  recently used entries are evicted beyond ``max_entries``.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+CACHE_DIR = os.environ.get(
+    "ATS_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "ats_resume")
+)
+
+TRACKING_PARAMS = {"fbclid", "gclid", "msclkid", "mc_cid", "mc_eid", "trk", "trackingid", "refid"}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+JobSummary = namedtuple("JobSummary", ["summary", "content_hash", "created_at", "checked_at"])
+
+
+def cache_path(filename):
+    """Return ``filename`` inside the cache directory, creating the directory."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, filename)
+
+
+def normalize_url(url):
+    """Canonical form of a job link for use as a cache key."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "https"
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, parts.path.rstrip("/") or "/", urlencode(query), ""))
+
+
+def content_hash(text):
+    """Hash of the page text, ignoring whitespace-only differences."""
+    return hashlib.sha256(" ".join(text.split()).encode("utf-8")).hexdigest()
+
+
+class JobSummaryCache:
+    """SQLite store of job summaries with revalidation by content hash."""
+
+    def __init__(self, db_path=None, recheck_after=6 * 60 * 60, ttl=7 * 24 * 60 * 60, max_entries=2000):
+        self.recheck_after = recheck_after
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path or cache_path("job_summaries.sqlite"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS job_summaries (
+                url TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                checked_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS job_summaries_lru ON job_summaries (accessed_at)")
+        self._db.commit()
+
+    def get(self, url):
+        """The unexpired entry for ``url``, or ``None``."""
+        key = normalize_url(url)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT summary, content_hash, created_at, checked_at FROM job_summaries WHERE url = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if time.time() - row[2] >= self.ttl:
+                self._db.execute("DELETE FROM job_summaries WHERE url = ?", (key,))
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE job_summaries SET accessed_at = ? WHERE url = ?", (time.time(), key))
+            self._db.commit()
+        return JobSummary(*row)
+
+    def put(self, url, summary, page_hash):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO job_summaries VALUES (?, ?, ?, ?, ?, ?)",
+                (normalize_url(url), summary, page_hash, now, now, now)
+            )
+            self._db.execute(
+                "DELETE FROM job_summaries WHERE url NOT IN "
+                "(SELECT url FROM job_summaries ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+            self._db.commit()
+
+    def mark_checked(self, url):
+        with self._lock:
+            self._db.execute("UPDATE job_summaries SET checked_at = ? WHERE url = ?",
+                             (time.time(), normalize_url(url)))
+            self._db.commit()
+
+    async def summarize(self, url, fetch, condense):
+        """Summary of the job at ``url``, calling ``fetch`` and ``condense`` only when needed.
+
+        ``fetch(url)`` returns the page text and ``condense(text)`` the LLM
+        summary; both are coroutine functions.
+        """
+        entry = self.get(url)
+        if entry is not None and time.time() - entry.checked_at < self.recheck_after:
+            return entry.summary
+        page = await fetch(url)
+        page_hash = content_hash(page)
+        if entry is not None and entry.content_hash == page_hash:
+            self.mark_checked(url)
+            return entry.summary
+        summary = await condense(page)
+        self.put(url, summary, page_hash)
+        return summary
@@ -0,0 +1,63 @@
+"""Dependency-aware async stage runner for the resume analyzer.
+
+Each stage is a coroutine function that receives the results of the stages
+it depends on, in order. Every stage starts as soon as its own inputs are
+ready, so independent stages (reading the PDF and fetching the job page,
+or writing the report and the mail) overlap and the run takes as long as
+its slowest dependency chain. ``on_done`` and ``on_error`` are called from
+the event loop as each stage settles, which lets the page draw results one
+by one.
+"""
+import asyncio
+from collections import namedtuple
+
+Stage = namedtuple("Stage", "name func deps")
+
+
+class UpstreamFailed(Exception):
+    """A stage was skipped because a stage it depends on failed."""
+
+
+async def run_pipeline(stages, inputs=None, on_done=None, on_error=None):
+    """Run ``stages`` (each listed after its dependencies) and return ``{name: result}``.
+
+    ``inputs`` maps names to ready-made values that stages can depend on.
+
+    A failed stage is reported once through ``on_error``; stages downstream
+    of it are skipped and left out of the result, while unrelated stages
+    still run to completion.
+    """
+    declared = set(inputs or ())
+    for stage in stages:
+        unknown = [dep for dep in stage.deps if dep not in declared]
+        if unknown:
+            raise ValueError(f"stage {stage.name!r} depends on undeclared {unknown}")
+        declared.add(stage.name)
+
+    tasks = {}
+    for name, value in (inputs or {}).items():
+        tasks[name] = asyncio.get_running_loop().create_future()
+        tasks[name].set_result(value)
+
+    async def run(stage):
+        args = []
+        for dep in stage.deps:
+            try:
+                args.append(await tasks[dep])
+            except Exception:
+                raise UpstreamFailed(dep) from None
+        try:
+            result = await stage.func(*args)
+        except Exception as e:
+            if on_error:
+                on_error(stage.name, e)
+            raise
+        if on_done:
+            on_done(stage.name, result)
+        return result
+
+    for stage in stages:
+        tasks[stage.name] = asyncio.ensure_future(run(stage))
+    names = [stage.name for stage in stages]
+    results = await asyncio.gather(*(tasks[name] for name in names), return_exceptions=True)
+    return {name: result for name, result in zip(names, results) if not isinstance(result, BaseException)}
@@ -0,0 +1,115 @@
+"""Compact structured digest of a resume, shared by every ATS prompt.
+
+Raw PDF text is long and noisy, and it used to be pasted whole into both the
+report and the mail prompts. A single extraction call turns it into a small
+JSON document (contact, skills, experience, projects, education) that both
+prompts consume instead. Digests are stored in SQLite under a hash of the
+PDF bytes and of the extraction prompt, so re-analysing the same resume
+against another job costs no LLM extraction at all.
+"""
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+
+from job_cache import cache_path
+
+DIGEST_TEMPLATE = """
+### RESUME TEXT:
+{resume_text}
+
+### INSTRUCTION:
+Extract the resume above into a single JSON object with exactly these keys:
+- "name": string
+- "contact": {{"email": string, "phone": string, "links": [string]}}
+- "summary": string, at most 40 words
+- "skills": [string], every technical and soft skill, tool, language and framework mentioned
+- "experience": [{{"title": string, "company": string, "duration": string, "highlights": [string]}}]
+- "projects": [{{"name": string, "technologies": [string], "highlights": [string]}}]
+- "education": [{{"degree": string, "institution": string, "year": string}}]
+- "certifications": [string]
+Keep each highlight under 25 words and keep numbers and metrics. Use "" or [] for anything missing.
+Reply with the JSON object only.
+"""
+
+DIGEST_VERSION = hashlib.sha256(DIGEST_TEMPLATE.encode("utf-8")).hexdigest()[:12]
+
+_JSON_OBJECT = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def pdf_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def parse_digest(text):
+    """The JSON object in an LLM reply (code fences and chatter allowed), or ``None``."""
+    match = _JSON_OBJECT.search(text or "")
+    if match is None:
+        return None
+    try:
+        digest = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return None
+    return digest if isinstance(digest, dict) else None
+
+
+def format_digest(digest):
+    """Digest as compact JSON for a prompt: no indentation, empty fields dropped."""
+    return json.dumps({key: value for key, value in digest.items() if value not in ("", [], {}, None)},
+                      ensure_ascii=False, separators=(",", ":"))
+
+
+class ResumeDigestCache:
+    """SQLite store of digests keyed by PDF content hash and extraction prompt."""
+
+    def __init__(self, db_path=None):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path or cache_path("resume_digests.sqlite"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS resume_digests (
+                pdf_hash TEXT NOT NULL,
+                version TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (pdf_hash, version)
+            )
+        """)
+        self._db.commit()
+
+    def get(self, key):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT digest FROM resume_digests WHERE pdf_hash = ? AND version = ?", (key, DIGEST_VERSION)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key, digest):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO resume_digests VALUES (?, ?, ?, ?)",
+                (key, DIGEST_VERSION, json.dumps(digest, ensure_ascii=False), time.time())
+            )
+            self._db.commit()
+
+    async def digest(self, data, text, extract):
+        """Prompt-ready digest of the PDF ``data``, whose extracted text is ``text``.
+
+        ``extract(text)`` is a coroutine function returning the LLM reply; it
+        only runs on a cache miss. If the call fails (a rate limit, say) or
+        the reply isn't valid JSON, the raw text is returned uncached so the
+        analysis can still go ahead.
+        """
+        key = pdf_hash(data)
+        digest = self.get(key)
+        if digest is None:
+            try:
+                digest = parse_digest(await extract(text))
+            except Exception:
+                return text
+            if digest is None:
+                return text
+            self.put(key, digest)
+        return format_digest(digest)
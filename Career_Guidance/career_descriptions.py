@@ -0,0 +1,228 @@
+"""Persistent, per-section cache of the LLM-written career descriptions.
+
+A description is eleven overview sections plus an actionable roadmap. Each
+one is its own short generation, so the pages can request them concurrently,
+show each as soon as it arrives and leave rarely read sections until they
+are expanded. Results are stored in SQLite keyed by (career, prompt version,
+model), where the prompt version hashes the section's own prompt: editing
+one section's wording regenerates only that section. There are only 17
+careers, so the whole cache can be filled ahead of time::
+
+    GROQ_API_KEY=... python Career_Guidance/career_descriptions.py warm
+
+after which "Predict Career" answers instantly. The same command lays out
+every career's roadmap SVG when Graphviz is installed.
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Shared"))
+from response_cache import cache_path
+
+from career_model import CAREER_CLASSES
+from career_roadmap import RoadmapRenderer, create_career_roadmap, roadmap_steps
+
+DEFAULT_MODEL = "llama-3.3-70b-versatile"
+
+Section = namedtuple("Section", "key title words guidance")
+
+SECTIONS = [
+    Section("overview", "Basic Career Overview", "100-120",
+            "Briefly describe the career, including the key responsibilities, goals, and daily tasks."),
+    Section("opportunities", "Career Opportunities", "80-100",
+            "Describe potential job titles, industries, and demand trends for this career."),
+    Section("skills", "Skills and Competencies", "120-150",
+            "List essential technical and soft skills, along with commonly used tools, software, or frameworks."),
+    Section("education", "Educational Qualifications", "80-100",
+            "Mention required degrees, certifications, and additional qualifications needed."),
+    Section("progression", "Career Path and Progression", "100-120",
+            "Outline typical career trajectories, starting positions, and advancement opportunities."),
+    Section("salary", "Salary and Job Outlook", "80-100",
+            "Provide average salary details and the job market outlook for this role."),
+    Section("eligibility", "Eligibility and Prerequisites", "80-100",
+            "Describe necessary qualifications, experience, or skills for entering the field."),
+    Section("trends", "Future Trends and Growth", "80-100",
+            "Highlight trends, emerging technologies, and areas of growth in the field."),
+    Section("environment", "Work Environment", "80-100",
+            "Describe the typical work setting: office, remote work, teamwork level, etc."),
+    Section("networking", "Networking and Community", "80-100",
+            "Discuss key networking opportunities, professional communities, and relevant events."),
+    Section("satisfaction", "Job Satisfaction and Impact", "80-100",
+            "Analyze job satisfaction, common challenges, and the impact of the work."),
+]
+# Generated as soon as a career is predicted; the rest wait until expanded.
+EAGER_SECTIONS = SECTIONS[:3]
+
+SECTION_TEMPLATE = """
+Write the "{title}" section ({words} words) of a structured overview of the {{predicted_career}} career.
+{guidance}
+Reply with the section text only, in markdown, without repeating the section title.
+"""
+
+ROADMAP = Section("roadmap", "Actionable Steps for Success", "", "")
+
+ROADMAP_TEMPLATE = """
+Provide a roadmap with specific, actionable steps for success in the {predicted_career} field. Group the steps as shown below:
+
+- Foundation:
+   - Programming Skills: steps[:2]
+   - Mathematical Fundamentals: steps[2:4]
+   - Computer Science Basics: steps[4:6]
+
+- Development:
+   - Core Skills Building: steps[6:9]
+   - Project Work: steps[9:11]
+   - Advanced Topics: steps[11:13]
+
+- Advanced:
+   - Specialization: steps[13:16]
+   - Portfolio Development: steps[16:18]
+   - Professional Networking: steps[18:20]
+
+Each step should be concise, actionable, and clearly aligned with the career path.
+The steps must be little descriptive for about 2 lines.
+The steps must be related real life. like the steps must be practical and related to technical too.
+"""
+
+
+def section_prompt(section):
+    """Prompt template for ``section``; ``{predicted_career}`` is its only variable."""
+    if section.key == ROADMAP.key:
+        return ROADMAP_TEMPLATE
+    return SECTION_TEMPLATE.format(title=section.title, words=section.words, guidance=section.guidance)
+
+
+def prompt_version(template):
+    return hashlib.sha256(template.encode("utf-8")).hexdigest()[:12]
+
+
+class DescriptionWriter:
+    """One LLM client with a prompt chain per section; build it once and reuse it."""
+
+    def __init__(self, api_key, model=DEFAULT_MODEL):
+        from langchain_groq import ChatGroq
+        from langchain.prompts import PromptTemplate
+        from langchain.chains import LLMChain
+
+        self.model = model
+        llm = ChatGroq(model=model, temperature=0, groq_api_key=api_key)
+        self._chains = {
+            section.key: LLMChain(llm=llm, prompt=PromptTemplate(input_variables=["predicted_career"],
+                                                                 template=section_prompt(section)))
+            for section in SECTIONS + [ROADMAP]
+        }
+
+    def write(self, career, section):
+        return self._chains[section.key].invoke({"predicted_career": career})["text"]
+
+
+class DescriptionCache:
+    """SQLite store of generated descriptions keyed by career, prompt version and model."""
+
+    def __init__(self, db_path=None):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path or cache_path("career_descriptions.sqlite"), check_same_thread=False)
+        self._db.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS descriptions (
+                career TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                model TEXT NOT NULL,
+                text TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (career, prompt_version, model)
+            );
+        """)
+
+    def get(self, career, section, model=DEFAULT_MODEL):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT text FROM descriptions WHERE career = ? AND prompt_version = ? AND model = ?",
+                (career, prompt_version(section_prompt(section)), model)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, career, section, text, model=DEFAULT_MODEL):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?, ?, ?)",
+                (career, prompt_version(section_prompt(section)), model, text, time.time())
+            )
+            self._db.commit()
+
+    def get_or_generate(self, career, section, writer):
+        """The cached section text, generating and storing it on a miss."""
+        text = self.get(career, section, writer.model)
+        if text is None:
+            text = writer.write(career, section)
+            self.put(career, section, text, writer.model)
+        return text
+
+    def iter_sections(self, career, sections, writer, executor):
+        """Yield ``(section, text)`` for ``sections``: cached ones at once, the rest as they finish.
+
+        Misses are generated concurrently on ``executor``. Only the generation
+        runs off the calling thread, so callers can draw each result as it
+        arrives.
+        """
+        pending = {}
+        for section in sections:
+            text = self.get(career, section, writer.model)
+            if text is None:
+                pending[executor.submit(self.get_or_generate, career, section, writer)] = section
+            else:
+                yield section, text
+        for future in as_completed(pending):
+            yield pending[future], future.result()
+
+
+def warm_up(cache, writer, careers=CAREER_CLASSES, sections=SECTIONS + [ROADMAP], force=False, workers=4, log=print):
+    """Generate every missing (or, with ``force``, every) section for ``careers`` concurrently."""
+    todo = [(career, section) for career in careers for section in sections
+            if force or cache.get(career, section, writer.model) is None]
+
+    def generate(item):
+        career, section = item
+        cache.put(career, section, writer.write(career, section), writer.model)
+        return item
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for career, section in executor.map(generate, todo):
+            log(f"cached {career}: {section.title}")
+    return len(todo)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the career description cache.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    warm_parser = subparsers.add_parser("warm", help="precompute every section and roadmap for every career")
+    warm_parser.add_argument("--model", default=DEFAULT_MODEL, help=f"default: {DEFAULT_MODEL}")
+    warm_parser.add_argument("--force", action="store_true", help="regenerate entries that already exist")
+    warm_parser.add_argument("--workers", type=int, default=4, help="concurrent requests (default: 4)")
+    args = parser.parse_args()
+
+    api_key = os.environ.get("GROQ_API_KEY")
+    if not api_key:
+        parser.error("set GROQ_API_KEY")
+    cache = DescriptionCache()
+    count = warm_up(cache, DescriptionWriter(api_key, args.model), force=args.force, workers=args.workers)
+    print(f"Generated {count} sections")
+
+    renderer = RoadmapRenderer()
+    if not renderer.available:
+        print("Graphviz 'dot' not found; skipping roadmap layouts")
+        return
+    for career in CAREER_CLASSES:
+        renderer.render(create_career_roadmap(career, roadmap_steps(cache.get(career, ROADMAP, args.model)))).result()
+    print(f"Laid out {len(CAREER_CLASSES)} roadmaps")
+
+
+if __name__ == "__main__":
+    main()
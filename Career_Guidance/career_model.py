@@ -0,0 +1,162 @@
+"""Skills-to-career classifier served with a plain NumPy forward pass.
+
+The model is a small MLP (17 knowledge ratings -> ReLU hidden layer ->
+softmax over the 17 careers). Its weights, label order and feature schema
+live in one ``.npz`` artifact, so serving needs NumPy only: no TensorFlow,
+Keras or scikit-learn import, a cold start of well under a second and
+predictions in microseconds.
+
+``train_career_model.py`` produces the artifacts, one numbered version per
+training run (``models/career_mlp-v<N>.npz``); the newest one is served.
+"""
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+MODEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models")
+MODEL_FILE = re.compile(r"career_mlp-v(\d+)\.npz$")
+
+FIELDS = [
+    'Database Fundamentals', 'Computer Architecture', 'Distributed Computing Systems',
+    'Cyber Security', 'Networking', 'Software Development', 'Programming Skills',
+    'Project Management', 'Computer Forensics Fundamentals', 'Technical Communication',
+    'AI ML', 'Software Engineering', 'Business Analysis', 'Communication skills',
+    'Data Science', 'Troubleshooting skills', 'Graphics Designing'
+]
+
+CAREER_CLASSES = [
+    "Database Administrator", "System Architect", "Cloud Engineer",
+    "Cybersecurity Analyst", "Network Engineer", "Software Developer",
+    "Programmer", "Project Manager", "Forensic Analyst",
+    "Technical Writer", "AI/ML Specialist", "Software Engineer",
+    "Business Analyst", "HR Specialist", "Data Scientist",
+    "IT Support Specialist", "Graphic Designer"
+]
+
+# Knowledge levels ordered by proficiency. The pages list them in a different
+# order for their sliders, so the model always works from level names.
+LEVEL_ORDER = ['Not Interested', 'Poor', 'Beginner', 'Average', 'Intermediate', 'Excellent', 'Professional']
+LEVEL_SCORES = {level: i for i, level in enumerate(LEVEL_ORDER)}
+
+
+def encode_levels(frame, fields, level_scores):
+    """Level scores for a DataFrame with one column per field.
+
+    Cells may be level names ("Average") or their numeric scores; anything
+    else raises ``ValueError`` naming the offending columns.
+    """
+    missing = [field for field in fields if field not in frame]
+    if missing:
+        raise ValueError(f"missing columns: {', '.join(missing)}")
+    features = np.empty((len(frame), len(fields)), dtype=np.float32)
+    for column, field in enumerate(fields):
+        values = frame[field]
+        if pd.api.types.is_numeric_dtype(values):
+            features[:, column] = values
+        else:
+            features[:, column] = values.astype(str).str.strip().map(level_scores)
+    unknown = [field for field, bad in zip(fields, np.isnan(features).any(axis=0)) if bad]
+    if unknown:
+        raise ValueError(f"unknown knowledge level in {', '.join(unknown)}; expected one of {list(level_scores)}")
+    return features
+
+
+class CareerModel:
+    """Loaded classifier: ``predict_proba`` over rows of knowledge ratings."""
+
+    def __init__(self, weights, labels, fields, level_scores, version="unversioned", metrics=None):
+        self.weights = weights
+        self.labels = list(labels)
+        self.fields = list(fields)
+        self.level_scores = dict(level_scores)
+        self.version = version
+        self.metrics = metrics or {}
+        self._scale = float(max(self.level_scores.values()))
+
+    def encode(self, levels):
+        """Map knowledge-level names (one row per profile) to model inputs."""
+        levels = np.asarray(levels, dtype=object)
+        if levels.ndim == 1:
+            levels = levels[None, :]
+        lookup = np.vectorize(self.level_scores.__getitem__, otypes=[np.float32])
+        return lookup(levels)
+
+    def predict_proba(self, features):
+        """Class probabilities for an ``(n, len(fields))`` array of level scores."""
+        hidden = np.asarray(features, dtype=np.float32) / self._scale
+        layers = len(self.weights) // 2
+        for layer in range(layers):
+            hidden = hidden @ self.weights[f"W{layer}"] + self.weights[f"b{layer}"]
+            if layer < layers - 1:
+                np.maximum(hidden, 0, out=hidden)
+        hidden -= hidden.max(axis=1, keepdims=True)
+        np.exp(hidden, out=hidden)
+        hidden /= hidden.sum(axis=1, keepdims=True)
+        return hidden
+
+    def top_k(self, features, k=3):
+        """``(labels, probabilities)`` of the ``k`` likeliest careers per row, best first."""
+        probabilities = self.predict_proba(features)
+        k = min(k, probabilities.shape[1])
+        best = np.argpartition(-probabilities, k - 1, axis=1)[:, :k]
+        order = np.take_along_axis(probabilities, best, axis=1).argsort(axis=1)[:, ::-1]
+        best = np.take_along_axis(best, order, axis=1)
+        return np.asarray(self.labels, dtype=object)[best], np.take_along_axis(probabilities, best, axis=1)
+
+    def score_profiles(self, profiles, k=3):
+        """Top-``k`` careers for every row of a DataFrame of profiles in one vectorized pass.
+
+        Columns other than the fields (a student name or ID, say) are kept
+        in front of ``Career 1``, ``Probability 1``, ... ``Career k``,
+        ``Probability k``.
+        """
+        labels, probabilities = self.top_k(encode_levels(profiles, self.fields, self.level_scores), k)
+        scored = profiles.drop(columns=self.fields).reset_index(drop=True)
+        for rank in range(labels.shape[1]):
+            scored[f"Career {rank + 1}"] = labels[:, rank]
+            scored[f"Probability {rank + 1}"] = np.round(probabilities[:, rank], 4)
+        return scored
+
+    def predict(self, levels, k=3):
+        """Top-``k`` ``[(career, probability), ...]`` for one profile of level names."""
+        labels, probabilities = self.top_k(self.encode(levels), k)
+        return list(zip(labels[0], probabilities[0].tolist()))
+
+
+def save_model(path, weights, labels, fields, level_scores, version="unversioned", metrics=None):
+    """Write weights plus the label order and feature schema to one ``.npz``."""
+    metadata = {
+        "version": version,
+        "labels": list(labels),
+        "fields": list(fields),
+        "level_scores": dict(level_scores),
+        "metrics": metrics or {},
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    np.savez_compressed(path, metadata=np.array(json.dumps(metadata)), **weights)
+
+
+def model_versions(model_dir=MODEL_DIR):
+    """Version numbers of the artifacts in ``model_dir``."""
+    if not os.path.isdir(model_dir):
+        return []
+    return sorted(int(match.group(1)) for match in map(MODEL_FILE.match, os.listdir(model_dir)) if match)
+
+
+def latest_model_path(model_dir=MODEL_DIR):
+    versions = model_versions(model_dir)
+    if not versions:
+        raise FileNotFoundError(f"no career model in {model_dir}; run train_career_model.py first")
+    return os.path.join(model_dir, f"career_mlp-v{versions[-1]}.npz")
+
+
+def load_model(path=None):
+    """Load ``path``, or the newest versioned artifact when no path is given."""
+    with np.load(path or latest_model_path()) as artifact:
+        metadata = json.loads(str(artifact["metadata"]))
+        weights = {name: artifact[name].astype(np.float32) for name in artifact.files if name != "metadata"}
+    return CareerModel(weights, metadata["labels"], metadata["fields"], metadata["level_scores"],
+                       metadata["version"], metadata["metrics"])
@@ -0,0 +1,145 @@
+"""Streamlit building blocks shared by the two career guidance pages.
+
+``career_guidance.py`` and ``Pathfinder.py`` differ only in their styling,
+Groq key and description model, so the model loading, class scoring,
+career descriptions and roadmap live here once. Cached resources are
+process-wide and therefore shared by both pages.
+"""
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import streamlit as st
+
+from career_descriptions import (DEFAULT_MODEL, EAGER_SECTIONS, ROADMAP, SECTIONS, DescriptionCache,
+                                 DescriptionWriter)
+from career_model import load_model
+from career_roadmap import RoadmapRenderer, create_career_roadmap, roadmap_steps
+
+# The bundled model's softmax is near one-hot, so only the ranking is shown.
+MODEL_NOTE = ("Ranked by career model {version}. No labelled dataset ships with the app, so the bundled "
+              "model is trained on synthetic profiles and its scores are not calibrated confidences.")
+# Seconds between checks for a finished roadmap layout.
+ROADMAP_POLL_SECONDS = 1
+
+
+@st.cache_resource
+def get_career_model():
+    """Skills-to-career classifier, loaded once per process."""
+    return load_model()
+
+
+def render_matches(matches):
+    """The runner-up careers of a prediction, plus where the ranking comes from."""
+    alternatives = [career for career, _ in matches[1:]]
+    if alternatives:
+        st.markdown("**Also worth a look:** " + ", ".join(alternatives))
+    st.caption(MODEL_NOTE.format(version=get_career_model().version))
+
+
+@st.cache_data(show_spinner="Scoring profiles...")
+def score_cohort(data, k):
+    """Top-``k`` careers for every student in an uploaded CSV, scored in one vectorized call."""
+    return get_career_model().score_profiles(pd.read_csv(io.BytesIO(data)), k)
+
+
+def render_batch_scoring():
+    model = get_career_model()
+    st.caption("One row per student: an optional name or ID column plus one column per field, "
+               "holding a knowledge level such as 'Average'.")
+    template = pd.DataFrame([["Student 1"] + ["Beginner"] * len(model.fields)], columns=["Student"] + model.fields)
+    st.download_button("Download CSV template", template.to_csv(index=False), "profiles_template.csv", "text/csv")
+    upload = st.file_uploader("Profiles CSV", type="csv")
+    k = st.number_input("Careers per student", min_value=1, max_value=len(model.labels), value=3)
+    if upload is None:
+        return
+    try:
+        scored = score_cohort(upload.getvalue(), int(k))
+    except ValueError as e:
+        st.error(f"Could not score {upload.name}: {e}")
+        return
+    st.caption(MODEL_NOTE.format(version=model.version))
+    st.bar_chart(scored["Career 1"].value_counts())
+    st.dataframe(scored.head(100), hide_index=True)
+    # The CSV is only serialized when the download is requested.
+    st.download_button(f"Download {len(scored)} results", lambda: scored.to_csv(index=False),
+                       "career_matches.csv", "text/csv")
+
+
+@st.cache_resource
+def get_description_writer(api_key, model=DEFAULT_MODEL):
+    return DescriptionWriter(api_key, model)
+
+
+@st.cache_resource
+def get_description_cache():
+    """Descriptions persist across reruns and restarts; see career_descriptions.py."""
+    return DescriptionCache()
+
+
+@st.cache_resource
+def get_description_executor():
+    return ThreadPoolExecutor(max_workers=len(SECTIONS) + 1)
+
+
+@st.cache_resource
+def get_roadmap_renderer():
+    """Roadmap SVGs persist across reruns and restarts; see career_roadmap.py."""
+    return RoadmapRenderer()
+
+
+@st.fragment(run_every=ROADMAP_POLL_SECONDS)
+def show_roadmap_preview(career, steps):
+    """Straight-edge preview that polls for the full layout, then reruns the page to swap it in."""
+    roadmap = create_career_roadmap(career, steps)
+    renderer = get_roadmap_renderer()
+    if renderer.cached(roadmap) is not None or renderer.failed(roadmap):
+        st.rerun()
+    st.graphviz_chart(create_career_roadmap(career, steps, splines='line'))
+    st.caption("Laying out the full roadmap...")
+
+
+def show_roadmap(slot, career, steps):
+    """Show the cached SVG, or start the layout and show a preview without waiting for it."""
+    roadmap = create_career_roadmap(career, steps)
+    renderer = get_roadmap_renderer()
+    svg = renderer.cached(roadmap)
+    if svg is not None:
+        slot.image(svg, width="stretch")
+    elif not renderer.available or renderer.failed(roadmap):
+        slot.graphviz_chart(roadmap)
+    else:
+        renderer.render(roadmap)
+        with slot.container():
+            show_roadmap_preview(career, steps)
+
+
+def render_career_description(career, api_key, model=DEFAULT_MODEL):
+    """Draw each section as soon as it is ready; collapsed sections are only written once opened."""
+    slots, wanted = {}, []
+    for section in SECTIONS:
+        expander = st.expander(section.title, expanded=section in EAGER_SECTIONS,
+                               key=f"section_{section.key}", on_change="rerun")
+        slots[section.key] = expander.empty()
+        if expander.open:
+            slots[section.key].caption("Writing...")
+            wanted.append(section)
+    with st.expander(ROADMAP.title, expanded=True):
+        slots[ROADMAP.key] = st.empty()
+        slots[ROADMAP.key].caption("Writing...")
+    wanted.append(ROADMAP)
+    st.markdown("<div class='stCard'>", unsafe_allow_html=True)
+    st.subheader("Your Career Roadmap")
+    roadmap_chart = st.empty()
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    sections = get_description_cache().iter_sections(career, wanted, get_description_writer(api_key, model),
+                                                     get_description_executor())
+    for section, text in sections:
+        slots[section.key].markdown(text)
+        if section is not ROADMAP:
+            continue
+        try:
+            show_roadmap(roadmap_chart, career, roadmap_steps(text))
+        except Exception as e:
+            roadmap_chart.error(f"Error creating roadmap: {str(e)}")
@@ -0,0 +1,140 @@
+"""Career roadmap graphs, laid out once and kept as SVG.
+
+Orthogonal edge routing (``splines='ortho'``) is the slow part of drawing a
+roadmap, and ``st.graphviz_chart`` repeats that layout in the browser on
+every rerun. :class:`RoadmapRenderer` instead runs the Graphviz ``dot``
+binary in a background worker and stores the SVG on disk under a hash of
+the graph source, which covers the career, its steps and the styling. A
+repeat view is a file read with no layout at all; while a new layout runs
+the pages show a straight-edge preview, which lays out almost instantly, and
+poll for the SVG without holding up the rest of the page. Without the
+``dot`` binary, or if the layout fails, the pages fall back to
+``st.graphviz_chart``.
+"""
+import hashlib
+import os
+import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import graphviz
+import regex as re
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Shared"))
+from response_cache import cache_path
+
+STEPS_PATTERN = re.compile(r"(?<=\s{3}-\s)(.*?)(?=\n|$)", re.DOTALL)
+
+PHASES = [
+    ('Foundation', ['Programming Skills', 'Mathematical Fundamentals', 'Computer Science Basics'], 2),
+    ('Development', ['Core Skills Building', 'Project Work', 'Advanced Topics'], 3),
+    ('Advanced', ['Specialization', 'Portfolio Development', 'Professional Networking'], 2),
+]
+
+
+def roadmap_steps(text):
+    """The roadmap steps listed in a generated "Actionable Steps" section."""
+    return [step.strip() for step in STEPS_PATTERN.findall(text) if step.strip()]
+
+
+def create_career_roadmap(career_field, steps, splines='ortho'):
+    """Create a graphviz roadmap visualization"""
+    dot = graphviz.Digraph(comment='Career Roadmap')
+    dot.attr(
+        rankdir='LR',
+        splines=splines,
+        bgcolor='#0B1120',
+        fontname='Arial',
+        fontcolor='white'
+    )
+    dot.attr('node',
+             shape='box',
+             style='filled,rounded',
+             fontname='Arial',
+             fontsize='12',
+             margin='0.2'
+             )
+    dot.attr('edge',
+             color='#4B5563',
+             penwidth='1.5'
+             )
+    phase_color = '#10B981'
+    category_color = '#F59E0B'
+    step_color = '#F87171'
+    dot.node('main', career_field, fillcolor='#3B82F6', fontcolor='white')
+    step_index = 0
+    for phase, categories, steps_per_category in PHASES:
+        phase_id = f'phase_{phase}'
+        dot.node(phase_id, phase, fillcolor=phase_color, fontcolor='white')
+        dot.edge('main', phase_id)
+        for cat_idx, category in enumerate(categories):
+            cat_id = f'{phase_id}cat{cat_idx}'
+            dot.node(cat_id, category, fillcolor=category_color, fontcolor='white')
+            dot.edge(phase_id, cat_id)
+            for step_idx in range(steps_per_category):
+                if step_index < len(steps):
+                    step_id = f'{cat_id}step{step_idx}'
+                    dot.node(step_id, steps[step_index], fillcolor=step_color, fontcolor='white')
+                    dot.edge(cat_id, step_id)
+                    step_index += 1
+    return dot
+
+
+class RoadmapRenderer:
+    """Lays graphs out to SVG on worker threads and keeps every result on disk."""
+
+    def __init__(self, cache_dir=None, workers=2):
+        self.cache_dir = cache_dir or cache_path("roadmaps")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.available = shutil.which("dot") is not None
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._lock = threading.Lock()
+        self._svgs = {}
+        self._pending = {}
+        self._failed = set()
+
+    @staticmethod
+    def key(dot):
+        return hashlib.sha256(dot.source.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.svg")
+
+    def cached(self, dot):
+        """The stored SVG for ``dot``, or None if it hasn't been laid out yet."""
+        key = self.key(dot)
+        svg = self._svgs.get(key)
+        if svg is None and os.path.exists(self._path(key)):
+            with open(self._path(key), encoding="utf-8") as f:
+                svg = self._svgs[key] = f.read()
+        return svg
+
+    def failed(self, dot):
+        """Whether laying ``dot`` out has already failed in this process."""
+        return self.key(dot) in self._failed
+
+    def render(self, dot):
+        """Future resolving to the SVG for ``dot``; concurrent requests share one layout."""
+        key = self.key(dot)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = self._executor.submit(self._layout, key, dot)
+        return future
+
+    def _layout(self, key, dot):
+        try:
+            svg = dot.pipe(format="svg", encoding="utf-8")
+            temporary = f"{self._path(key)}.{threading.get_ident()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as f:
+                f.write(svg)
+            os.replace(temporary, self._path(key))
+            self._svgs[key] = svg
+            return svg
+        except Exception:
+            self._failed.add(key)
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
@@ -0,0 +1,231 @@
+"""Train the skills-to-career MLP from a CSV dataset and export a versioned artifact.
+
+The CSV has one column per field in ``FIELDS`` (knowledge-level names such as
+"Average", or their 0-6 proficiency scores) plus a label column naming the
+career. It is streamed in chunks, so millions of rows never have to fit in
+memory; a fixed hash of the row number sets aside a held-out split, which is
+scored after training. Training is plain NumPy (mini-batch Adam on softmax
+cross-entropy), matching the forward pass used for serving, and each run
+writes ``models/career_mlp-v<N>.npz`` with the weights, label order, feature
+schema and metrics. The pages load the newest version::
+
+    python Career_Guidance/train_career_model.py train profiles.csv --epochs 5
+
+No labelled dataset ships with the repo, so the bundled artifact was trained
+on synthetic profiles drawn from the 1:1 alignment between ``FIELDS`` and
+``CAREER_CLASSES``::
+
+    python Career_Guidance/train_career_model.py synthesize profiles.csv --rows 1000000
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from career_model import (CAREER_CLASSES, FIELDS, LEVEL_ORDER, LEVEL_SCORES, MODEL_DIR, CareerModel, encode_levels,
+                          model_versions, save_model)
+
+LABEL_COLUMN = "Role"
+
+
+def synthetic_profiles(n, seed=0):
+    """``(features, labels)`` for ``n`` made-up students.
+
+    Each student's career is drawn uniformly; its aligned field is rated
+    Intermediate or better and at least as high as any other, up to two other
+    fields are Average or better, and the rest range from Not Interested to
+    Average.
+    """
+    rng = np.random.default_rng(seed)
+    top = len(LEVEL_ORDER) - 1
+    labels = rng.integers(0, len(CAREER_CLASSES), n)
+    features = rng.integers(0, 4, (n, len(FIELDS))).astype(np.float32)
+    rows = np.arange(n)
+    aligned = rng.integers(top - 2, top + 1, n)
+    for _ in range(2):
+        related = rng.integers(0, len(FIELDS), n)
+        features[rows, related] = np.maximum(features[rows, related], rng.integers(3, top, n))
+    # The aligned field is usually the student's strongest; a fifth of the
+    # students only tie with another field, which keeps the classes overlapping.
+    lead = (rng.random(n) > 0.2).astype(np.float32)
+    features[rows, labels] = np.minimum(top, np.maximum(aligned, features.max(axis=1) + lead))
+    return features, labels
+
+
+def init_weights(sizes, seed=0):
+    rng = np.random.default_rng(seed)
+    weights = {}
+    for layer, (fan_in, fan_out) in enumerate(zip(sizes, sizes[1:])):
+        weights[f"W{layer}"] = (rng.standard_normal((fan_in, fan_out)) * np.sqrt(2 / fan_in)).astype(np.float32)
+        weights[f"b{layer}"] = np.zeros(fan_out, dtype=np.float32)
+    return weights
+
+
+class Adam:
+    """Adam over a dict of weight arrays, updated in place."""
+
+    def __init__(self, weights, lr=1e-2, beta1=0.9, beta2=0.999, eps=1e-8):
+        self.lr, self.beta1, self.beta2, self.eps = lr, beta1, beta2, eps
+        self.m = {name: np.zeros_like(value) for name, value in weights.items()}
+        self.v = {name: np.zeros_like(value) for name, value in weights.items()}
+        self.t = 0
+
+    def step(self, weights, grads):
+        self.t += 1
+        for name, grad in grads.items():
+            self.m[name] = self.beta1 * self.m[name] + (1 - self.beta1) * grad
+            self.v[name] = self.beta2 * self.v[name] + (1 - self.beta2) * grad * grad
+            m_hat = self.m[name] / (1 - self.beta1 ** self.t)
+            v_hat = self.v[name] / (1 - self.beta2 ** self.t)
+            weights[name] -= self.lr * m_hat / (np.sqrt(v_hat) + self.eps)
+
+
+def train_step(weights, optimizer, features, labels, scale):
+    """One mini-batch of softmax cross-entropy backprop; returns the batch loss."""
+    layers = len(weights) // 2
+    activations = [features / scale]
+    for layer in range(layers):
+        z = activations[-1] @ weights[f"W{layer}"] + weights[f"b{layer}"]
+        activations.append(np.maximum(z, 0) if layer < layers - 1 else z)
+    logits = activations[-1] - activations[-1].max(axis=1, keepdims=True)
+    probabilities = np.exp(logits)
+    probabilities /= probabilities.sum(axis=1, keepdims=True)
+    rows = np.arange(len(labels))
+    loss = float(-np.log(probabilities[rows, labels] + 1e-12).mean())
+
+    grad = probabilities
+    grad[rows, labels] -= 1
+    grad /= len(labels)
+    grads = {}
+    for layer in reversed(range(layers)):
+        grads[f"W{layer}"] = activations[layer].T @ grad
+        grads[f"b{layer}"] = grad.sum(axis=0)
+        if layer:
+            grad = (grad @ weights[f"W{layer}"].T) * (activations[layer] > 0)
+    optimizer.step(weights, grads)
+    return loss
+
+
+def write_synthetic_csv(path, rows, seed=0, chunk_rows=100_000):
+    """Write ``rows`` synthetic profiles to ``path`` in the training CSV format."""
+    written = 0
+    for chunk, start in enumerate(range(0, rows, chunk_rows)):
+        features, labels = synthetic_profiles(min(chunk_rows, rows - start), seed + chunk)
+        frame = pd.DataFrame(np.asarray(LEVEL_ORDER, dtype=object)[features.astype(int)], columns=FIELDS)
+        frame[LABEL_COLUMN] = np.asarray(CAREER_CLASSES, dtype=object)[labels]
+        frame.to_csv(path, mode="w" if chunk == 0 else "a", header=chunk == 0, index=False)
+        written += len(frame)
+    return written
+
+
+def is_holdout(row_numbers, fraction):
+    """Deterministic split: the same rows are held out on every pass and every run."""
+    mixed = (row_numbers.astype(np.uint64) * np.uint64(2654435761)) % np.uint64(2 ** 32)
+    return mixed < np.uint64(fraction * 2 ** 32)
+
+
+def scan_labels(path, label_column=LABEL_COLUMN, chunk_rows=200_000):
+    """The sorted set of careers in the dataset, read from the label column only."""
+    labels = set()
+    for chunk in pd.read_csv(path, usecols=[label_column], chunksize=chunk_rows):
+        labels.update(chunk[label_column].dropna().astype(str).unique())
+    return sorted(labels)
+
+
+def iter_chunks(path, labels, holdout, train, label_column=LABEL_COLUMN, chunk_rows=200_000):
+    """Yield ``(features, label_indices)`` per CSV chunk, for the train or held-out split."""
+    label_index = {label: i for i, label in enumerate(labels)}
+    offset = 0
+    for chunk in pd.read_csv(path, usecols=FIELDS + [label_column], chunksize=chunk_rows):
+        rows = np.arange(offset, offset + len(chunk))
+        offset += len(chunk)
+        chunk = chunk[is_holdout(rows, holdout) != train]
+        chunk = chunk[chunk[label_column].astype(str).isin(label_index.keys())]
+        if chunk.empty:
+            continue
+        try:
+            features = encode_levels(chunk, FIELDS, LEVEL_SCORES)
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from None
+        yield features, chunk[label_column].astype(str).map(label_index).to_numpy()
+
+
+def train(path, epochs=5, hidden=64, batch_size=512, learning_rate=1e-2, holdout=0.1,
+          label_column=LABEL_COLUMN, chunk_rows=200_000, seed=0, log=print):
+    """Train on the CSV at ``path``; returns a ``CareerModel`` with held-out metrics."""
+    labels = scan_labels(path, label_column, chunk_rows)
+    if not labels:
+        raise ValueError(f"{path}: no labels in column {label_column!r}")
+    weights = init_weights([len(FIELDS), hidden, len(labels)], seed)
+    optimizer = Adam(weights, lr=learning_rate)
+    scale = float(len(LEVEL_ORDER) - 1)
+    rng = np.random.default_rng(seed)
+    train_rows = 0
+    for epoch in range(epochs):
+        losses = []
+        train_rows = 0
+        for features, targets in iter_chunks(path, labels, holdout, True, label_column, chunk_rows):
+            order = rng.permutation(len(targets))
+            for start in range(0, len(order), batch_size):
+                batch = order[start:start + batch_size]
+                losses.append(train_step(weights, optimizer, features[batch], targets[batch], scale))
+            train_rows += len(targets)
+        log(f"epoch {epoch + 1}/{epochs}: mean loss {np.mean(losses):.4f} over {train_rows} rows")
+
+    model = CareerModel(weights, labels, FIELDS, LEVEL_SCORES)
+    correct = total = 0
+    for features, targets in iter_chunks(path, labels, holdout, False, label_column, chunk_rows):
+        correct += int((model.predict_proba(features).argmax(axis=1) == targets).sum())
+        total += len(targets)
+    model.metrics = {
+        "holdout_accuracy": correct / total if total else None,
+        "holdout_rows": total,
+        "train_rows": train_rows,
+        "epochs": epochs,
+        "dataset": os.path.basename(path),
+        "trained_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the career classifier.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    train_parser = subparsers.add_parser("train", help="train from a CSV and write a new model version")
+    train_parser.add_argument("dataset", help="CSV with one column per field plus the label column")
+    train_parser.add_argument("--label-column", default=LABEL_COLUMN, help=f"default: {LABEL_COLUMN}")
+    train_parser.add_argument("--epochs", type=int, default=5, help="passes over the data (default: 5)")
+    train_parser.add_argument("--hidden", type=int, default=64, help="hidden units (default: 64)")
+    train_parser.add_argument("--batch-size", type=int, default=512, help="rows per update (default: 512)")
+    train_parser.add_argument("--learning-rate", type=float, default=1e-2, help="Adam step size (default: 0.01)")
+    train_parser.add_argument("--holdout", type=float, default=0.1, help="held-out fraction (default: 0.1)")
+    train_parser.add_argument("--chunk-rows", type=int, default=200_000,
+                              help="CSV rows read per chunk (default: 200000)")
+    train_parser.add_argument("--model-dir", default=MODEL_DIR, help="where versions are written")
+    synth_parser = subparsers.add_parser("synthesize", help="write a synthetic training CSV")
+    synth_parser.add_argument("output", help="CSV path to write")
+    synth_parser.add_argument("--rows", type=int, default=100_000, help="profiles to generate (default: 100000)")
+    synth_parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.command == "synthesize":
+        print(f"Wrote {write_synthetic_csv(args.output, args.rows, args.seed)} profiles to {args.output}")
+        return
+
+    model = train(args.dataset, args.epochs, args.hidden, args.batch_size, args.learning_rate,
+                  args.holdout, args.label_column, args.chunk_rows)
+    versions = model_versions(args.model_dir)
+    model.version = f"v{(max(versions) if versions else 0) + 1}"
+    path = os.path.join(args.model_dir, f"career_mlp-{model.version}.npz")
+    save_model(path, model.weights, model.labels, model.fields, model.level_scores, model.version, model.metrics)
+    if model.metrics["holdout_accuracy"] is None:
+        print("held-out accuracy: not measured (no held-out rows)")
+    else:
+        print(f"held-out accuracy: {model.metrics['holdout_accuracy']:.3f} on {model.metrics['holdout_rows']} rows")
+    print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,28 +3,31 @@ pip install beautifulsoup4
 pip install pandas 
 pip install lxml'''
 
+import os
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 
+BASE_URL = os.environ.get("COURSERA_BASE_URL", "https://www.coursera.org")
+
 course_name = input("Enter the course name: ")
 
 course_split = course_name.split()
 
 if len(course_split) == 1:
-    url = f"https://www.coursera.org/search?query={course_split[0]}"
+    url = f"{BASE_URL}/search?query={course_split[0]}"
 elif len(course_split) == 2:
-    url = f"https://www.coursera.org/search?query={course_split[0]}%20{course_split[1]}"
+    url = f"{BASE_URL}/search?query={course_split[0]}%20{course_split[1]}"
 elif len(course_split) == 3:
-    url = f"https://www.coursera.org/search?query={course_split[0]}%20{course_split[1]}%20{course_split[2]}"
+    url = f"{BASE_URL}/search?query={course_split[0]}%20{course_split[1]}%20{course_split[2]}"
 elif len(course_split) == 4:
-    url = f"https://www.coursera.org/search?query={course_split[0]}%20{course_split[1]}%20{course_split[2]}%20{course_split[3]}"
+    url = f"{BASE_URL}/search?query={course_split[0]}%20{course_split[1]}%20{course_split[2]}%20{course_split[3]}"
 elif len(course_split) == 5:
-    url = f"https://www.coursera.org/search?query={course_split[0]}%20{course_split[1]}%20{course_split[2]}%20{course_split[3]}%20{course_split[4]}"
+    url = f"{BASE_URL}/search?query={course_split[0]}%20{course_split[1]}%20{course_split[2]}%20{course_split[3]}%20{course_split[4]}"
 elif len(course_split) == 6:
-    url = f"https://www.coursera.org/search?query={course_split[0]}%20{course_split[1]}%20{course_split[2]}%20{course_split[3]}%20{course_split[4]}%20{course_split[5]}"
+    url = f"{BASE_URL}/search?query={course_split[0]}%20{course_split[1]}%20{course_split[2]}%20{course_split[3]}%20{course_split[4]}%20{course_split[5]}"
 else:
-    url = f"https://www.coursera.org/search?query={course_split[0]}%20{course_split[1]}%20{course_split[2]}%20{course_split[3]}%20{course_split[4]}%20{course_split[5]}%20{course_split[6]}"
+    url = f"{BASE_URL}/search?query={course_split[0]}%20{course_split[1]}%20{course_split[2]}%20{course_split[3]}%20{course_split[4]}%20{course_split[5]}%20{course_split[6]}"
 
 response = requests.get(url)
 soup = BeautifulSoup(response.text, "lxml")
@@ -1,8 +1,20 @@
+import os
+import sys
 import streamlit as st
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 import time
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Shared"))
+from course_index import CourseIndex
+from fetch_scheduler import get_scheduler
+from image_cache import ImageCache
+from response_cache import ResponseCache, normalize_query
+from result_list import image_data_uri, render_result_list
+from pagination import iter_result_pages
+from sources import COURSERA_CARD, coursera_page_url, coursera_search_url, parse_courses
 
 st.set_page_config(
     page_title="Course Finder",
@@ -52,21 +64,6 @@ st.markdown("""
         box-shadow: 0 0 20px rgba(0, 128, 255, 0.5);
     }
 
-    /* Course card styling */
-    .course-card {
-        background-color: #2d2d2d;
-        padding: 1.5rem;
-        border-radius: 10px;
-        margin: 1rem 0;
-        box-shadow: 0 0 15px rgba(0, 128, 255, 0.1);
-        transition: all 0.3s ease;
-    }
-
-    .course-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 0 20px rgba(0, 128, 255, 0.2);
-    }
-
     /* Link styling */
     a {
         color: #0099ff;
@@ -78,32 +75,6 @@ st.markdown("""
         color: #00ccff;
     }
 
-    /* Rating badge styling */
-    .rating-badge {
-        background: linear-gradient(45deg, #00cc66, #00ff80);
-        padding: 0.3rem 0.8rem;
-        border-radius: 15px;
-        color: #1a1a1a;
-        font-weight: bold;
-    }
-
-    /* Level badge styling */
-    .level-badge {
-        background: linear-gradient(45deg, #ff6600, #ff9933);
-        padding: 0.3rem 0.8rem;
-        border-radius: 15px;
-        color: #1a1a1a;
-        font-weight: bold;
-    }
-
-    /* Skills section styling */
-    .skills-section {
-        background-color: #363636;
-        padding: 1rem;
-        border-radius: 5px;
-        margin-top: 0.5rem;
-    }
-
     /* Download button styling */
     .download-button {
         background: linear-gradient(45deg, #009933, #00cc44);
@@ -118,52 +89,121 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def create_search_url(course_name):
-    course_split = course_name.split()
-    search_terms = '%20'.join(course_split)
-    return f"https://www.coursera.org/search?query={search_terms}"
+# Styles for the result list iframe, which doesn't see the page's CSS.
+COURSE_CARD_CSS = """
+.course-card {
+    background-color: #2d2d2d;
+    padding: 1.5rem;
+    border-radius: 10px;
+    margin: 1rem 0;
+    box-shadow: 0 0 15px rgba(0, 128, 255, 0.1);
+    transition: all 0.3s ease;
+}
+.course-card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 0 20px rgba(0, 128, 255, 0.2);
+}
+a { color: #0099ff; transition: color 0.3s ease; }
+a:hover { color: #00ccff; }
+.rating-badge, .level-badge {
+    padding: 0.3rem 0.8rem;
+    border-radius: 15px;
+    color: #1a1a1a;
+    font-weight: bold;
+}
+.rating-badge { background: linear-gradient(45deg, #00cc66, #00ff80); }
+.level-badge { background: linear-gradient(45deg, #ff6600, #ff9933); }
+.course-card .body {
+    background-color: #363636;
+    padding: 1rem;
+    border-radius: 5px;
+    margin-top: 0.5rem;
+}
+.pager { color: #cccccc; }
+.pager button { background: linear-gradient(45deg, #0066cc, #0099ff); color: white; }
+"""
+
+# Upper bound for simultaneous searches in batch mode. The fetch scheduler
+# still paces the requests they make to coursera.org.
+MAX_CONCURRENT_SEARCHES = 16
+DEFAULT_CONCURRENT_SEARCHES = 8
+RESULTS_PER_PAGE = 10
+DEFAULT_MAX_RESULTS = 20
+# Local matches for a query that was never crawled itself (only other
+# searches' courses mention it) only count as a hit from this many results.
+MIN_LOCAL_RESULTS = 10
+MAX_RESULTS_LIMIT = 200
+
+
+@st.cache_resource
+def get_fetch_scheduler():
+    """Polite fetch queue shared by every session in the process."""
+    return get_scheduler()
+
+
+@st.cache_resource
+def get_response_cache():
+    """Process-wide Coursera response cache."""
+    return ResponseCache("coursera")
+
+
+@st.cache_resource
+def get_course_index():
+    """Process-wide handle on the local full-text course index."""
+    return CourseIndex()
+
+
+@st.cache_resource
+def get_image_cache():
+    """Process-wide thumbnail cache for course card images."""
+    return ImageCache(session=get_fetch_scheduler())
 
 
-def get_course_data(url):
+def create_search_url(course_name):
+    return coursera_search_url(normalize_query(course_name))
+
+
+def parse_course_list(query):
+    """Split a comma-separated query string into unique, non-empty course names."""
+    course_names = []
+    seen = set()
+    for name in query.split(","):
+        name = " ".join(name.split())
+        if name and name.lower() not in seen:
+            seen.add(name.lower())
+            course_names.append(name)
+    return course_names
+
+
+def iter_course_data(url, max_results=DEFAULT_MAX_RESULTS, client=None):
+    """Walk Coursera result pages for a search URL, yielding one DataFrame per page.
+
+    Stops after ``max_results`` courses or when the results run out; raises on
+    fetch errors.
+    """
+    client = client or get_fetch_scheduler()
+    cache = get_response_cache()
+    pages = iter_result_pages(
+        lambda page_url: cache.fetch(client, page_url),
+        lambda page: coursera_page_url(url, page),
+        lambda html: parse_courses(html, limit=None),
+        max_results
+    )
+    for records in pages:
+        yield pd.DataFrame(records, columns=COURSERA_CARD.columns)
+
+
+def fetch_course_data(url, client=None, max_results=5):
+    """Fetch and parse up to ``max_results`` courses for a search URL; raises on failure."""
+    frames = list(iter_course_data(url, max_results, client))
+    if not frames:
+        return pd.DataFrame(columns=COURSERA_CARD.columns)
+    return pd.concat(frames, ignore_index=True)
+
+
+def get_course_data(url, max_results=5):
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        educators_list = [educator.text for educator in
-                          soup.find_all("p", class_="cds-ProductCard-partnerNames css-vac8rf")[:5]]
-        course_titles_list = [title.text for title in soup.find_all("h3", class_="cds-CommonCard-title css-6ecy9b")[:5]]
-        skills_list = [skill.text for skill in soup.find_all("div", class_="cds-CommonCard-bodyContent")[:5]]
-        ratings = soup.find_all("div", class_="cds-RatingStat-meter")
-        ratings_list = [rate.text.split("Rating")[0].strip() for rate in ratings[:5]]
-        hyperlinks_list = ["https://www.coursera.org" + hyperlink["href"] for hyperlink in
-                           soup.find_all("a",
-                                         class_="cds-119 cds-113 cds-115 cds-CommonCard-titleLink css-vflzcf cds-142")[
-                           :5]]
-        levels_list = [level.text.split()[0] for level in soup.find_all("div", class_="cds-CommonCard-metadata")[:5]]
-
-        images_div = soup.find_all("img")
-        images_list = []
-        for i in images_div[5:10]:
-            if 'src' in i.attrs:
-                images_list.append(i['src'])
-            else:
-                images_list.append('')
-
-        return pd.DataFrame({
-            "Course Title": course_titles_list,
-            "Educator": educators_list,
-            "Skills": skills_list,
-            "Rating": ratings_list,
-            "Link": hyperlinks_list,
-            "Level": levels_list,
-            "Images Link": images_list
-        })
-
+        return fetch_course_data(url, max_results=max_results)
     except requests.RequestException as e:
         st.error(f"Error fetching data: {str(e)}")
         return None
@@ -172,6 +212,115 @@ def get_course_data(url):
         return None
 
 
+def get_courses_batch(course_names, max_workers=DEFAULT_CONCURRENT_SEARCHES):
+    """Search several courses concurrently and merge the results.
+
+    Returns a ``(DataFrame, errors)`` tuple. The frame carries a
+    ``Search Query`` column and is de-duplicated on the course link, keeping
+    the first query that found it; ``errors`` maps failed queries to messages.
+    """
+    max_workers = max(1, min(max_workers, MAX_CONCURRENT_SEARCHES, len(course_names) or 1))
+    # Resolve the cached resources on the script thread before the workers use them.
+    client = get_fetch_scheduler()
+    get_response_cache()
+    frames = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(fetch_course_data, create_search_url(name), client): name
+            for name in course_names
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                frames[name] = future.result()
+            except Exception as e:
+                errors[name] = str(e)
+
+    ordered = [frames[name].assign(**{"Search Query": name}) for name in course_names if name in frames]
+    if not ordered:
+        return pd.DataFrame(), errors
+    merged = pd.concat(ordered, ignore_index=True)
+    merged = merged.drop_duplicates(subset="Link", keep="first").reset_index(drop=True)
+    return merged, errors
+
+
+def filter_courses(course_data, level=None, min_rating=None):
+    if level:
+        course_data = course_data[course_data["Level"] == level]
+    if min_rating:
+        course_data = course_data[pd.to_numeric(course_data["Rating"], errors="coerce") >= min_rating]
+    return course_data
+
+
+def stream_live_courses(course_name, level=None, min_rating=None, max_results=DEFAULT_MAX_RESULTS):
+    """Scrape Coursera page by page, redrawing the result list as each page is parsed.
+
+    Every page is written to the local index so the next search is answered
+    locally. Returns all rendered courses for the CSV download.
+    """
+    index = get_course_index()
+    heading = st.empty()
+    results = st.empty()
+    progress = st.empty()
+    frames = []
+    loaded = 0
+    try:
+        for page in iter_course_data(create_search_url(course_name), max_results):
+            index.add(page.to_dict("records"))
+            loaded += len(page)
+            frames.append(filter_courses(page, level, min_rating))
+            heading.markdown("### 🎯 Search Results", unsafe_allow_html=True)
+            # Redraw the one result list in place rather than adding a list per page.
+            with results.container():
+                render_course_cards(pd.concat(frames, ignore_index=True))
+            progress.caption(f"Live results from coursera.org: loaded {loaded} of up to {max_results} courses…")
+    except requests.RequestException as e:
+        st.error(f"Error fetching data: {str(e)}")
+    else:
+        if loaded:
+            index.mark_indexed(course_name)
+    progress.caption(f"Live results from coursera.org: {loaded} courses loaded")
+    if not frames:
+        return pd.DataFrame(columns=COURSERA_CARD.columns)
+    return pd.concat(frames, ignore_index=True)
+
+
+def reset_result_page():
+    st.session_state.result_page = 1
+
+
+def render_course_cards(course_data):
+    """Draw the courses as one paginated result list, with thumbnails inlined."""
+    thumbnails = get_image_cache().get_many(course_data["Images Link"])
+    cards = []
+    for row in course_data.to_dict("records"):
+        thumbnail = thumbnails.get(row["Images Link"])
+        cards.append({
+            "title": row["Course Title"],
+            "link": row["Link"],
+            "image": image_data_uri(thumbnail) if thumbnail else row["Images Link"],
+            "subtitle": f"🏫 Educator: {row['Educator']}",
+            "badges": [["level-badge", f"📚 {row['Level']}"], ["rating-badge", f"⭐ {row['Rating']}"]],
+            "body_label": "🎯 Skills you'll gain:",
+            "body": row["Skills"],
+        })
+    render_result_list(cards, COURSE_CARD_CSS, "course-card", per_page=RESULTS_PER_PAGE, card_height=240)
+
+
+def render_download(course_data):
+    # Download section
+    st.markdown('<div class="download-button">', unsafe_allow_html=True)
+    csv = course_data.to_csv(index=False)
+    st.download_button(
+        label="📥 Download Results as CSV",
+        data=csv,
+        file_name="coursera_search_results.csv",
+        mime="text/csv"
+    )
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
 def main():
     st.markdown('<div class="main-header">', unsafe_allow_html=True)
     st.title("🎓 Course Finder")
@@ -182,58 +331,85 @@ def main():
     """, unsafe_allow_html=True)
     st.markdown('</div>', unsafe_allow_html=True)
 
+    search_mode = st.radio("Search mode", ["Single course", "Multiple courses"], horizontal=True)
+    batch_mode = search_mode == "Multiple courses"
+
     # Search section
     col1, col2 = st.columns([3, 1])
     with col1:
-        course_name = st.text_input("", placeholder="Enter course name (e.g., Python Programming)")
+        if batch_mode:
+            course_name = st.text_input("", placeholder="Enter course names separated by commas (e.g., Python, SQL, ML)")
+        else:
+            course_name = st.text_input("", placeholder="Enter course name (e.g., Python Programming)")
     with col2:
         search_button = st.button("🔍 Search Courses")
 
+    if batch_mode:
+        max_workers = st.slider("Parallel searches", 1, MAX_CONCURRENT_SEARCHES, DEFAULT_CONCURRENT_SEARCHES)
+
+        if search_button and course_name:
+            with st.spinner("🔍 Searching for the best courses..."):
+                course_data, errors = get_courses_batch(parse_course_list(course_name), max_workers)
+                for name, message in errors.items():
+                    st.error(f"Error fetching data for '{name}': {message}")
+
+                if not course_data.empty:
+                    st.markdown("### 🎯 Search Results", unsafe_allow_html=True)
+                    render_course_cards(course_data)
+                    render_download(course_data)
+                else:
+                    st.error("😕 No courses found. Please try a different search term.")
+        elif search_button:
+            st.warning("⚠ Please enter a course name to search.")
+        return
+
+    with st.expander("Filters"):
+        col1, col2 = st.columns(2)
+        with col1:
+            level = st.selectbox("Level", ["Any"] + get_course_index().levels(), on_change=reset_result_page)
+        with col2:
+            min_rating = st.slider("Minimum rating", 0.0, 5.0, 0.0, 0.5, on_change=reset_result_page)
+        max_results = st.slider("Courses to load from Coursera when searching live",
+                                5, MAX_RESULTS_LIMIT, DEFAULT_MAX_RESULTS, 5)
+
     if search_button and course_name:
-        with st.spinner("🔍 Searching for the best courses..."):
-            url = create_search_url(course_name)
-            course_data = get_course_data(url)
-
-            if course_data is not None and not course_data.empty:
-                st.markdown("### 🎯 Search Results", unsafe_allow_html=True)
-
-                # Display courses in enhanced cards
-                for idx, row in course_data.iterrows():
-                    st.markdown('<div class="course-card">', unsafe_allow_html=True)
-                    col1, col2 = st.columns([1, 3])
-
-                    with col1:
-                        st.image(row["Images Link"], use_container_width=True)
-
-                    with col2:
-                        st.markdown(f"""
-                        <h3><a href="{row['Link']}" target="_blank">{row['Course Title']}</a></h3>
-                        <p><strong>🏫 Educator:</strong> {row['Educator']}</p>
-                        <span class="level-badge">📚 {row['Level']}</span>
-                        <span class="rating-badge">⭐ {row['Rating']}</span>
-                        <div class="skills-section">
-                            <strong>🎯 Skills you'll gain:</strong><br>
-                            {row['Skills']}
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                    st.markdown('</div>', unsafe_allow_html=True)
-
-                # Download section
-                st.markdown('<div class="download-button">', unsafe_allow_html=True)
-                csv = course_data.to_csv(index=False)
-                st.download_button(
-                    label="📥 Download Results as CSV",
-                    data=csv,
-                    file_name="coursera_search_results.csv",
-                    mime="text/csv"
-                )
-                st.markdown('</div>', unsafe_allow_html=True)
-            else:
-                st.error("😕 No courses found. Please try a different search term.")
+        st.session_state.course_query = course_name
+        reset_result_page()
     elif search_button:
         st.warning("⚠ Please enter a course name to search.")
 
+    query = st.session_state.get("course_query")
+    if not query:
+        return
+
+    level = None if level == "Any" else level
+    page = st.session_state.get("result_page", 1)
+    index = get_course_index()
+    indexed = index.has_query(query)
+    course_data, total = index.search(query, level, min_rating or None, page, RESULTS_PER_PAGE)
+    live = not total or (not indexed and total < MIN_LOCAL_RESULTS)
+    if not live:
+        st.markdown("### 🎯 Search Results", unsafe_allow_html=True)
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.caption(f"{total} matching courses in the local index")
+        if not indexed:
+            # Only other searches' courses matched; let the user ask Coursera itself.
+            with col2:
+                live = st.button("🌐 Search Coursera live")
+    if live:
+        course_data = stream_live_courses(query, level, min_rating or None, max_results)
+    else:
+        render_course_cards(course_data)
+        page_count = math.ceil(total / RESULTS_PER_PAGE)
+        if page_count > 1:
+            st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, key="result_page")
+
+    if not course_data.empty:
+        render_download(course_data)
+    else:
+        st.error("😕 No courses found. Please try a different search term.")
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
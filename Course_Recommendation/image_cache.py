@@ -0,0 +1,132 @@
+"""Local thumbnail cache for course card images.
+
+Each remote image is downloaded once, shrunk to a card-sized WebP (or JPEG
+when Pillow lacks WebP support) and stored under a hash of its URL. Reads
+refresh the file's mtime, and the least recently used thumbnails are removed
+once the directory grows past its disk quota. Without Pillow the original
+bytes are cached unchanged.
+"""
+import hashlib
+import io
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Shared"))
+from response_cache import cache_path
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+THUMBNAIL_SIZE = (480, 270)
+DEFAULT_QUOTA_BYTES = 100 * 1024 * 1024
+
+
+class ImageCache:
+    """Disk-backed, quota-bounded cache of course thumbnails keyed by URL hash."""
+
+    def __init__(self, directory=None, quota_bytes=DEFAULT_QUOTA_BYTES, session=None, max_workers=8):
+        self.directory = directory or cache_path("thumbnails")
+        self.quota_bytes = quota_bytes
+        self.session = session or requests.Session()
+        self.max_workers = max_workers
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path_for(self, url):
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".thumb")
+
+    def get_many(self, urls):
+        """Map each URL to local thumbnail bytes, downloading misses concurrently.
+
+        URLs that are empty or fail to download map to ``None`` so callers can
+        fall back to the remote image.
+        """
+        images = {}
+        misses = []
+        for url in dict.fromkeys(urls):
+            if not url:
+                images[url] = None
+                continue
+            data = self._read(url)
+            if data is None:
+                misses.append(url)
+            else:
+                images[url] = data
+
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(misses))) as executor:
+                images.update(zip(misses, executor.map(self._download, misses)))
+            self._evict()
+        return images
+
+    def get(self, url):
+        return self.get_many([url])[url]
+
+    def _read(self, url):
+        path = self.path_for(url)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return data
+
+    def _download(self, url):
+        try:
+            response = self.session.get(url, timeout=15)
+            response.raise_for_status()
+            data = self._thumbnail(response.content)
+        except (requests.RequestException, OSError):
+            return None
+        path = self.path_for(url)
+        # Write then rename so a concurrent reader never sees a partial file;
+        # the temp name is per thread since sessions share this cache.
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            # The thumbnail is still usable even if it couldn't be stored.
+            pass
+        return data
+
+    def _thumbnail(self, data):
+        if Image is None:
+            return data
+        with Image.open(io.BytesIO(data)) as image:
+            image = image.convert("RGB")
+            image.thumbnail(THUMBNAIL_SIZE)
+            output = io.BytesIO()
+            try:
+                image.save(output, "WEBP", quality=80)
+            except (KeyError, OSError):
+                output = io.BytesIO()
+                image.save(output, "JPEG", quality=85, optimize=True)
+            return output.getvalue()
+
+    def _evict(self):
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as files:
+            for entry in files:
+                if entry.name.endswith(".thumb"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        if total <= self.quota_bytes:
+            return
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            total -= size
+            if total <= self.quota_bytes:
+                break
@@ -1,11 +1,24 @@
+import os
+import sys
 import streamlit as st
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-import re
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Shared"))
+from fetch_scheduler import get_scheduler
+from response_cache import ResponseCache, normalize_query
+from result_list import render_result_list
+from pagination import iter_result_pages
+from sources import TIMESJOBS_CARD, parse_jobs, timesjobs_page_url, timesjobs_search_url
+from course_index import CourseIndex
+from skill_gap import SkillGapMatcher, split_skills
+from job_store import JobStore
+from job_analytics import (append_snapshot, compact_snapshots, keyword_trends, load_history,
+                           title_frequency, top_companies_over_time)
 
 # Configure Streamlit theme
 st.set_page_config(
@@ -50,18 +63,6 @@ st.markdown("""
         }
     }
 
-    @keyframes cardFloat {
-        0% {
-            transform: translateY(0);
-        }
-        50% {
-            transform: translateY(-5px);
-        }
-        100% {
-            transform: translateY(0);
-        }
-    }
-
     /* Enhanced search box */
     .stTextInput input {
         background-color: rgba(30, 27, 75, 0.7);
@@ -100,26 +101,6 @@ st.markdown("""
         background: linear-gradient(45deg, #6d28d9, #8b5cf6);
     }
 
-    /* Enhanced job card */
-    .job-card {
-        background: linear-gradient(145deg, rgba(30, 27, 75, 0.9), rgba(49, 46, 129, 0.7));
-        padding: 2rem;
-        border-radius: 20px;
-        margin: 1.5rem 0;
-        border: 1px solid rgba(139, 92, 246, 0.2);
-        transition: all 0.4s ease;
-        box-shadow: 0 0 25px rgba(139, 92, 246, 0.1);
-        backdrop-filter: blur(10px);
-        animation: cardFloat 6s infinite ease-in-out;
-    }
-
-    .job-card:hover {
-        transform: translateY(-7px) scale(1.01);
-        box-shadow: 0 0 35px rgba(139, 92, 246, 0.3);
-        border-color: rgba(139, 92, 246, 0.5);
-        background: linear-gradient(145deg, rgba(49, 46, 129, 0.9), rgba(30, 27, 75, 0.7));
-    }
-
     /* Improved metrics card */
     .metric-card {
         background: linear-gradient(145deg, rgba(30, 27, 75, 0.8), rgba(49, 46, 129, 0.6));
@@ -192,48 +173,180 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-def create_search_url(job_name):
-    """Create search URL from job name."""
-    job_name_split = job_name.split()
-    job_name_title = job_name.title()
-    keywords = '+'.join(job_name_split)
-    return f'https://www.timesjobs.com/candidate/job-search.html?searchType=personalizedSearch&from=submit&searchTextSrc=&searchTextText="{job_name_title}"&txtKeywords={keywords}&txtLocation='
+DEFAULT_MAX_RESULTS = 20
+MAX_RESULTS_LIMIT = 200
+JOBS_PER_PAGE = 10
+# The scheduler only lets a few requests reach TimesJobs at once, so more
+# search threads than this would just sit waiting for a slot.
+MAX_CONCURRENT_SEARCHES = 8
+
+# Styles for the result list iframe, which doesn't see the page's CSS.
+JOB_CARD_CSS = """
+.job-card {
+    background: linear-gradient(145deg, rgba(30, 27, 75, 0.9), rgba(49, 46, 129, 0.7));
+    padding: 1.5rem 2rem;
+    border-radius: 20px;
+    margin: 1rem 0;
+    border: 1px solid rgba(139, 92, 246, 0.2);
+    transition: all 0.4s ease;
+    box-shadow: 0 0 25px rgba(139, 92, 246, 0.1);
+}
+.job-card:hover {
+    transform: translateY(-3px);
+    box-shadow: 0 0 35px rgba(139, 92, 246, 0.3);
+    border-color: rgba(139, 92, 246, 0.5);
+}
+.job-card .subtitle { color: #a5b4fc; }
+.job-card .posted { color: #c4b5fd; font-size: 0.9rem; }
+.action-button {
+    background: linear-gradient(45deg, #5271ff, #5c4dff);
+    padding: 0.5rem 1rem;
+    border-radius: 5px;
+    text-align: center;
+    color: white;
+}
+.pager { color: #c4b5fd; }
+.pager button { background: linear-gradient(45deg, #8b5cf6, #6d28d9); color: white; }
+"""
+
+
+@st.cache_resource
+def get_response_cache():
+    """Process-wide TimesJobs response cache."""
+    return ResponseCache("timesjobs")
+
+
+@st.cache_resource
+def get_job_store():
+    """Process-wide persistent job store."""
+    return JobStore()
+
+
+@st.cache_resource
+def compact_history():
+    """Merge partitions left one file per search by older versions, once per process."""
+    compact_snapshots()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def get_history(start, end, queries):
+    """Snapshot history for a date range and searches; cleared whenever a search is recorded."""
+    compact_history()
+    return load_history(start, end, list(queries))
+
+
+def create_search_url(job_name, location=""):
+    """Create search URL from job name and optional location."""
+    return timesjobs_search_url(normalize_query(job_name), location=" ".join(location.split()))
+
+
+def split_terms(text):
+    """Split comma-separated input into unique, non-empty terms, keeping their order."""
+    terms = {}
+    for term in text.split(","):
+        term = " ".join(term.split())
+        if term:
+            terms.setdefault(term.lower(), term)
+    return list(terms.values())
+
+
+@st.cache_resource
+def get_course_index():
+    """The course catalog built by Course Finder and ``course_index.py ingest``."""
+    return CourseIndex()
+
+
+@st.cache_resource(max_entries=1)
+def get_skill_matcher(catalog_version):
+    """TF-IDF matcher over the course catalog, rebuilt only when the catalog changes.
+
+    Only the latest catalog version is kept; older matrices are dropped.
+    """
+    return SkillGapMatcher(get_course_index().catalog())
+
+
+@st.cache_resource
+def get_fetch_scheduler():
+    """Polite fetch queue shared by every session in the process."""
+    return get_scheduler()
+
+
+def iter_jobs(url, max_results=DEFAULT_MAX_RESULTS):
+    """Walk TimesJobs result pages, yielding one DataFrame per page; raises on failure."""
+    cache = get_response_cache()
+    client = get_fetch_scheduler()
+    pages = iter_result_pages(
+        lambda page_url: cache.fetch(client, page_url),
+        lambda page: timesjobs_page_url(url, page),
+        lambda html: parse_jobs(html, limit=None),
+        max_results
+    )
+    for records in pages:
+        yield pd.DataFrame(records, columns=TIMESJOBS_CARD.columns)
 
 
-def scrape_jobs(url):
-    """Scrape job data from TimesJobs."""
+def scrape_jobs(url, max_results=5):
+    """Scrape up to ``max_results`` jobs from TimesJobs."""
     try:
-        response = requests.get(url)
-        soup = BeautifulSoup(response.text, "lxml")
-
-        job_titles_list = []
-        job_titles = soup.find_all("h2", class_="heading-trun")
-        for job_title in job_titles[:5]:
-            job_titles_list.append(job_title["title"])
-
-        company_names_list = []
-        company_names = soup.find_all("h3", class_="joblist-comp-name")
-        for company_name in company_names[:5]:
-            company_name = company_name.text
-            cleaned_company_name = re.sub(r'\s+', ' ', company_name).strip()
-            company_names_list.append(cleaned_company_name)
-
-        hyperlinks_list = []
-        hyperlinks = soup.find_all("a", class_="posoverlay_srp")
-        for hyperlink in hyperlinks[:5]:
-            hyperlinks_list.append(hyperlink["href"])
-
-        return pd.DataFrame({
-            "Job Title": job_titles_list,
-            "Company Name": company_names_list,
-            "Link": hyperlinks_list,
-            "Posted Date": [datetime.now().strftime("%Y-%m-%d")] * len(job_titles_list)
-        })
+        frames = list(iter_jobs(url, max_results))
+        if not frames:
+            return pd.DataFrame(columns=TIMESJOBS_CARD.columns)
+        return pd.concat(frames, ignore_index=True)
     except Exception as e:
         st.error(f"Error scraping data: {str(e)}")
         return None
 
 
+def scrape_jobs_fanout(keywords, locations, max_results=DEFAULT_MAX_RESULTS):
+    """Run one search per (keyword, location) pair concurrently and combine them.
+
+    The fetch scheduler keeps requests to TimesJobs within its per-host rate and
+    concurrency limits however many pairs there are. Returns ``(DataFrame, errors)``: the frame carries
+    ``Keyword`` and ``Location`` columns and lists each posting once, under
+    the first pair that found it; ``errors`` maps failed pairs to messages.
+    """
+    pairs = list(product(keywords, locations or [""]))
+    # Resolve the cached resources on the script thread before the workers use them.
+    get_response_cache()
+    get_fetch_scheduler()
+
+    def search(pair):
+        keyword, location = pair
+        frames = list(iter_jobs(create_search_url(keyword, location), max_results))
+        if not frames:
+            return pd.DataFrame(columns=TIMESJOBS_CARD.columns)
+        return pd.concat(frames, ignore_index=True)
+
+    frames = []
+    errors = {}
+    with ThreadPoolExecutor(max_workers=min(len(pairs), MAX_CONCURRENT_SEARCHES)) as executor:
+        futures = [(pair, executor.submit(search, pair)) for pair in pairs]
+        for (keyword, location), future in futures:
+            try:
+                frame = future.result()
+            except Exception as e:
+                errors[(keyword, location)] = str(e)
+                continue
+            frames.append(frame.assign(Keyword=keyword, Location=location or "Anywhere"))
+
+    if not frames:
+        return pd.DataFrame(columns=TIMESJOBS_CARD.columns + ["Keyword", "Location"]), errors
+    combined = pd.concat(frames, ignore_index=True).drop_duplicates(subset="Link").reset_index(drop=True)
+    return combined, errors
+
+
+def record_jobs(df, job_name):
+    """Upsert a scrape into the job store and date each posting by when it was first seen."""
+    store = get_job_store()
+    counts = store.upsert(df.to_dict("records"), job_name)
+    first_seen = store.first_seen(df["Link"].tolist())
+    df["Posted Date"] = [
+        datetime.fromtimestamp(first_seen[link]).strftime("%Y-%m-%d") if link in first_seen else ""
+        for link in df["Link"]
+    ]
+    return counts
+
+
 def create_company_distribution(df):
     """Create company distribution visualization."""
     company_counts = df['Company Name'].value_counts()
@@ -243,8 +356,13 @@ def create_company_distribution(df):
         hole=0.5,
         marker=dict(colors=px.colors.sequential.Plasma)
     )])
+    return style_figure(fig, "Company Distribution")
+
+
+def style_figure(fig, title):
+    """Apply the dashboard's transparent dark theme to a figure."""
     fig.update_layout(
-        title="Company Distribution",
+        title=title,
         paper_bgcolor='rgba(0,0,0,0)',
         plot_bgcolor='rgba(0,0,0,0)',
         font=dict(color='white'),
@@ -253,16 +371,129 @@ def create_company_distribution(df):
     return fig
 
 
-def main():
-    # Header
-    st.markdown('<div class="main-header">', unsafe_allow_html=True)
-    st.title("💼 Job Search Dashboard")
-    st.markdown("""
-    <p style='font-size: 1.2rem; color: #a5b4fc;'>
-        Find your dream job with real-time job market insights
-    </p>
-    """, unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+def render_insights(df):
+    # Display metrics
+    st.markdown("### 📊 Job Market Insights")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("Total Jobs Found", len(df))
+        st.markdown('</div>', unsafe_allow_html=True)
+    with col2:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("Unique Companies", df['Company Name'].nunique())
+        st.markdown('</div>', unsafe_allow_html=True)
+    with col3:
+        st.markdown('<div class="metric-card">', unsafe_allow_html=True)
+        st.metric("Latest Posting", df['Posted Date'].max())
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Visualizations
+    st.markdown("### 📈 Analytics")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(create_company_distribution(df), use_container_width=True)
+    with col2:
+        # Word cloud of job titles
+        st.markdown("#### 🏢 Popular Job Titles")
+        # One element for the whole list, however many postings were loaded.
+        st.markdown("\n".join(f"- {title}" for title in df['Job Title'].unique()))
+
+
+def render_job_cards(df):
+    """Draw the postings as one paginated result list."""
+    cards = [
+        {
+            "title": row["Job Title"],
+            "link": row["Link"],
+            "subtitle": row["Company Name"],
+            "badges": [["posted", row.get("Posted", "")]],
+            "action": "View Job",
+        }
+        for row in df.to_dict("records")
+    ]
+    render_result_list(cards, JOB_CARD_CSS, "job-card", per_page=JOBS_PER_PAGE, card_height=130)
+
+
+def render_skill_gap(df, known_skills=""):
+    """Recommend catalog courses that teach what these jobs ask for."""
+    st.markdown("### 📚 Courses That Close the Gap")
+    index = get_course_index()
+    matcher = get_skill_matcher(index.last_updated())
+    if not len(matcher):
+        st.info("The course catalog is empty. Search on Course Finder or run "
+                "`python Shared/course_index.py ingest queries.txt` to build it.")
+        return
+    matches = matcher.match(df, split_skills(known_skills))
+    if matches.empty:
+        st.info("No catalog courses match the skills in these postings.")
+        return
+    st.caption(f"Ranked against {len(matcher)} courses in the local catalog")
+    st.dataframe(matches, use_container_width=True, hide_index=True,
+                 column_config={"Link": st.column_config.LinkColumn("Link")})
+    uncovered = matcher.uncovered_skills(df)
+    if uncovered:
+        st.caption("Not taught by any catalog course yet: " + ", ".join(uncovered[:15]))
+
+
+def render_fanout():
+    """Compare several job titles across several locations in one combined table."""
+    col1, col2 = st.columns(2)
+    with col1:
+        keywords = st.text_input("Job titles", placeholder="Data Scientist, ML Engineer")
+    with col2:
+        locations = st.text_input("Locations", placeholder="Bangalore, Pune, Hyderabad")
+    max_results = st.slider("Jobs per search", 5, MAX_RESULTS_LIMIT, 10, 5)
+    if not st.button("🔍 Compare Jobs"):
+        return
+
+    keywords = split_terms(keywords)
+    locations = split_terms(locations)
+    if not keywords:
+        st.warning("⚠ Please enter at least one job title to search.")
+        return
+
+    with st.spinner(f"🔍 Running {len(keywords) * max(len(locations), 1)} searches..."):
+        df, errors = scrape_jobs_fanout(keywords, locations, max_results)
+    for (keyword, location), message in errors.items():
+        st.error(f"Error scraping '{keyword}' in {location or 'any location'}: {message}")
+    if df.empty:
+        st.error("😕 No jobs found. Please try different titles or locations.")
+        return
+
+    groups = []
+    for keyword, group in df.groupby("Keyword", sort=False):
+        group = group.copy()
+        record_jobs(group, keyword)
+        append_snapshot(group, keyword)
+        groups.append(group)
+    get_history.clear()
+    df = pd.concat(groups).sort_index()
+
+    st.markdown("### 📊 Postings by Location")
+    counts = df.groupby(["Location", "Keyword"], sort=False).size().rename("Jobs").reset_index()
+    fig = px.bar(counts, x="Location", y="Jobs", color="Keyword", barmode="group",
+                 color_discrete_sequence=px.colors.sequential.Plasma)
+    st.plotly_chart(style_figure(fig, "Jobs Found per Location"), use_container_width=True)
+
+    st.markdown("### 🎯 Combined Job Listings")
+    columns = ["Location", "Keyword", "Job Title", "Company Name", "Posted Date", "Link"]
+    st.dataframe(df[columns], use_container_width=True, hide_index=True,
+                 column_config={"Link": st.column_config.LinkColumn("Link", display_text="View Job")})
+    st.download_button(
+        label="📥 Download Job List",
+        data=df[columns].to_csv(index=False),
+        file_name=f"job_comparison_{datetime.now().strftime('%Y%m%d')}.csv",
+        mime="text/csv"
+    )
+
+
+def render_search():
+    """Search TimesJobs and show the results with market insights."""
+    search_mode = st.radio("Search mode", ["Single search", "Compare locations & titles"], horizontal=True)
+    if search_mode != "Single search":
+        render_fanout()
+        return
 
     # Search section
     col1, col2 = st.columns([3, 1])
@@ -271,75 +502,142 @@ def main():
     with col2:
         search_button = st.button("🔍 Search Jobs")
 
+    max_results = st.slider("Jobs to load", 5, MAX_RESULTS_LIMIT, DEFAULT_MAX_RESULTS, 5)
+    known_skills = st.text_input("Skills you already have (optional)",
+                                 placeholder="Python, SQL, Excel",
+                                 help="Left out when recommending courses for these jobs")
+
     if search_button and job_name:
+        url = create_search_url(job_name)
+        # Insights need every page, so reserve their slot above the listings
+        # and fill it once the listings have streamed in.
+        insights = st.container()
+        heading = st.empty()
+        results = st.empty()
+        progress = st.empty()
+        frames = []
+        counts = {"new": 0, "changed": 0}
         with st.spinner("🔍 Searching for jobs..."):
-            url = create_search_url(job_name)
-            df = scrape_jobs(url)
-
-            if df is not None and not df.empty:
-                # Display metrics
-                st.markdown("### 📊 Job Market Insights")
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                    st.metric("Total Jobs Found", len(df))
-                    st.markdown('</div>', unsafe_allow_html=True)
-                with col2:
-                    st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                    st.metric("Unique Companies", df['Company Name'].nunique())
-                    st.markdown('</div>', unsafe_allow_html=True)
-                with col3:
-                    st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                    st.metric("Latest Update", df['Posted Date'].iloc[0])
-                    st.markdown('</div>', unsafe_allow_html=True)
-
-                # Visualizations
-                st.markdown("### 📈 Analytics")
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.plotly_chart(create_company_distribution(df), use_container_width=True)
-                with col2:
-                    # Word cloud of job titles
-                    st.markdown("#### 🏢 Popular Job Titles")
-                    for title in df['Job Title'].unique():
-                        st.markdown(f"• {title}")
-
-                # Job listings
-                st.markdown("### 🎯 Job Listings")
-                for _, row in df.iterrows():
-                    st.markdown('<div class="job-card">', unsafe_allow_html=True)
-                    col1, col2 = st.columns([3, 1])
-                    with col1:
-                        st.markdown(f"""
-                        <h3>{row['Job Title']}</h3>
-                        <p style='color: #a5b4fc;'>{row['Company Name']}</p>
-                        """, unsafe_allow_html=True)
-                    with col2:
-                        st.markdown(f"""
-                        <a href="{row['Link']}" target="_blank">
-                            <div style='background: linear-gradient(45deg, #5271ff, #5c4dff);
-                                      padding: 0.5rem 1rem;
-                                      border-radius: 5px;
-                                      text-align: center;
-                                      color: white;'>
-                                View Job
-                            </div>
-                        </a>
-                        """, unsafe_allow_html=True)
-                    st.markdown('</div>', unsafe_allow_html=True)
-
-                # Export option
-                st.download_button(
-                    label="📥 Download Job List",
-                    data=df.to_csv(index=False),
-                    file_name=f"job_search_results_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.error("😕 No jobs found. Please try a different search term.")
+            try:
+                for page in iter_jobs(url, max_results):
+                    page_counts = record_jobs(page, job_name)
+                    counts["new"] += page_counts["new"]
+                    counts["changed"] += page_counts["changed"]
+                    frames.append(page)
+                    heading.markdown("### 🎯 Job Listings")
+                    # Redraw the one result list in place rather than adding a list per page.
+                    with results.container():
+                        render_job_cards(pd.concat(frames, ignore_index=True))
+                    progress.caption(f"Loaded {sum(len(frame) for frame in frames)} of up to {max_results} jobs…")
+            except Exception as e:
+                st.error(f"Error scraping data: {str(e)}")
+
+        if frames:
+            df = pd.concat(frames, ignore_index=True)
+            append_snapshot(df, job_name)
+            get_history.clear()
+            progress.caption(f"Loaded {len(df)} jobs")
+            with insights:
+                st.caption(f"{counts['new']} new and {counts['changed']} updated postings since the last search")
+                render_insights(df)
+            render_skill_gap(df, known_skills)
+
+            # Export option
+            st.download_button(
+                label="📥 Download Job List",
+                data=df.to_csv(index=False),
+                file_name=f"job_search_results_{datetime.now().strftime('%Y%m%d')}.csv",
+                mime="text/csv"
+            )
+        else:
+            st.error("😕 No jobs found. Please try a different search term.")
     elif search_button:
         st.warning("⚠ Please enter a job title to search.")
 
 
+def render_history():
+    """Browse postings from earlier searches without scraping again."""
+    store = get_job_store()
+    queries = store.queries()
+    if not queries:
+        st.info("No searches recorded yet. Run a search to start building your job history.")
+        return
+
+    query = st.selectbox("Past search", queries)
+    history = store.history(query)
+    st.metric("Postings Seen", len(history))
+    st.dataframe(history, use_container_width=True, hide_index=True)
+    st.download_button(
+        label="📥 Download History",
+        data=history.to_csv(index=False),
+        file_name=f"job_history_{query.replace(' ', '_')}.csv",
+        mime="text/csv"
+    )
+
+
+def render_analytics():
+    """Job-market trends over every recorded search, read from the Parquet history."""
+    today = datetime.now().date()
+    col1, col2 = st.columns(2)
+    with col1:
+        date_range = st.date_input("Date range", value=(today - timedelta(days=30), today))
+    with col2:
+        # The job store indexes every recorded query, so listing them never scans the snapshots.
+        queries = st.multiselect("Searches", get_job_store().queries(), placeholder="All searches")
+    if len(date_range) != 2:
+        st.info("Pick an end date to see the trends.")
+        return
+
+    history = get_history(date_range[0], date_range[1], tuple(sorted(queries)))
+    if history.empty:
+        st.info("No job postings recorded in this range yet. Run a few searches to build the history.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Postings Seen", history["link"].nunique())
+    with col2:
+        st.metric("Hiring Companies", history["company"].nunique())
+    with col3:
+        st.metric("Searches Recorded", history["query"].nunique())
+
+    companies = top_companies_over_time(history)
+    fig = px.line(companies, x="period", y="postings", color="company", markers=True,
+                  color_discrete_sequence=px.colors.sequential.Plasma)
+    st.plotly_chart(style_figure(fig, "Top Hiring Companies Over Time"), use_container_width=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        titles = title_frequency(history)
+        fig = px.bar(titles, x="postings", y="title", orientation="h",
+                     color_discrete_sequence=["#8b5cf6"])
+        fig.update_yaxes(autorange="reversed")
+        st.plotly_chart(style_figure(fig, "Most Frequent Job Titles"), use_container_width=True)
+    with col2:
+        keywords = keyword_trends(history)
+        fig = px.line(keywords, x="period", y="postings", color="keyword", markers=True)
+        st.plotly_chart(style_figure(fig, "Title Keyword Trends"), use_container_width=True)
+
+
+def main():
+    # Header
+    st.markdown('<div class="main-header">', unsafe_allow_html=True)
+    st.title("💼 Job Search Dashboard")
+    st.markdown("""
+    <p style='font-size: 1.2rem; color: #a5b4fc;'>
+        Find your dream job with real-time job market insights
+    </p>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    search_tab, history_tab, analytics_tab = st.tabs(["🔍 Search", "🕘 History", "📈 Market Analytics"])
+    with search_tab:
+        render_search()
+    with history_tab:
+        render_history()
+    with analytics_tab:
+        render_analytics()
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,155 @@
+"""Columnar history of scraped postings and the job-market analytics built on it.
+
+Every search adds its postings to a Hive-style date partition
+(``snapshot_date=YYYY-MM-DD/``). Each partition is kept as a single Parquet
+file, which an append rewrites and atomically replaces. Queries go through
+``pyarrow.dataset`` with a filter on the partition column, so a 30-day view
+opens 30 files however many searches ran. The aggregations are plain vectorized pandas and stay well under a
+second for tens of thousands of rows.
+"""
+import os
+import sys
+import threading
+import uuid
+from datetime import datetime, timezone
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Shared"))
+from response_cache import cache_path, normalize_query
+
+SNAPSHOT_SCHEMA = pa.schema([
+    ("scraped_at", pa.timestamp("s", tz="UTC")),
+    ("query", pa.string()),
+    ("title", pa.string()),
+    ("company", pa.string()),
+    ("link", pa.string()),
+    ("posted", pa.string()),
+])
+PARTITIONING = ds.partitioning(pa.schema([("snapshot_date", pa.string())]), flavor="hive")
+
+# Words too generic to say anything about a title trend.
+TITLE_STOPWORDS = {
+    "and", "for", "the", "with", "of", "in", "to", "a", "an", "at", "on", "or",
+    "sr", "jr", "senior", "junior", "lead", "ii", "iii", "i", "urgent", "hiring", "opening",
+}
+
+
+DAY_FILE = "part-0.parquet"
+_partition_lock = threading.Lock()
+
+
+def snapshot_dir():
+    return cache_path("job_snapshots")
+
+
+def append_snapshot(df, query, scraped_at=None, root=None):
+    """Write one search's postings as a new file in today's partition."""
+    scraped_at = scraped_at or datetime.now(timezone.utc)
+    table = pa.table({
+        "scraped_at": [scraped_at] * len(df),
+        "query": [normalize_query(query)] * len(df),
+        "title": df["Job Title"].tolist(),
+        "company": df["Company Name"].tolist(),
+        "link": df["Link"].tolist(),
+        "posted": df["Posted"].tolist() if "Posted" in df else [""] * len(df),
+    }, schema=SNAPSHOT_SCHEMA)
+    partition = os.path.join(root or snapshot_dir(), f"snapshot_date={scraped_at:%Y-%m-%d}")
+    os.makedirs(partition, exist_ok=True)
+    with _partition_lock:
+        _rewrite_partition(partition, table)
+
+
+def _rewrite_partition(partition, extra=None):
+    """Merge a partition's files (plus ``extra`` rows) into its one day file."""
+    files = sorted(os.path.join(partition, name) for name in os.listdir(partition)
+                   if name.endswith(".parquet") and not name.startswith((".", "_")))
+    if extra is None and len(files) <= 1:
+        return
+    tables = [pq.read_table(path, schema=SNAPSHOT_SCHEMA) for path in files]
+    if extra is not None:
+        tables.append(extra)
+    target = os.path.join(partition, DAY_FILE)
+    # Dot-prefixed, so a concurrent dataset scan skips the half-written file.
+    temporary = os.path.join(partition, f".{uuid.uuid4().hex}.tmp")
+    pq.write_table(pa.concat_tables(tables), temporary)
+    os.replace(temporary, target)
+    for path in files:
+        if path != target:
+            os.remove(path)
+
+
+def compact_snapshots(root=None):
+    """Merge partitions written one file per search by older versions."""
+    root = root or snapshot_dir()
+    if not os.path.isdir(root):
+        return
+    with _partition_lock:
+        for name in os.listdir(root):
+            partition = os.path.join(root, name)
+            if name.startswith("snapshot_date=") and os.path.isdir(partition):
+                _rewrite_partition(partition)
+
+
+def load_history(start=None, end=None, queries=None, columns=None, root=None):
+    """Read snapshots between two dates (inclusive), touching only those partitions."""
+    root = root or snapshot_dir()
+    if not os.path.isdir(root) or not os.listdir(root):
+        return pd.DataFrame(columns=columns or SNAPSHOT_SCHEMA.names + ["snapshot_date"])
+
+    dataset = ds.dataset(root, format="parquet", schema=SNAPSHOT_SCHEMA.append(
+        pa.field("snapshot_date", pa.string())), partitioning=PARTITIONING)
+    condition = None
+    if start is not None:
+        condition = ds.field("snapshot_date") >= f"{start:%Y-%m-%d}"
+    if end is not None:
+        upper = ds.field("snapshot_date") <= f"{end:%Y-%m-%d}"
+        condition = upper if condition is None else condition & upper
+    if queries:
+        wanted = ds.field("query").isin([normalize_query(query) for query in queries])
+        condition = wanted if condition is None else condition & wanted
+    return dataset.to_table(columns=columns, filter=condition).to_pandas()
+
+
+def top_companies_over_time(history, top_n=8, freq="W"):
+    """Distinct postings per period for the ``top_n`` companies overall."""
+    if history.empty:
+        return pd.DataFrame(columns=["period", "company", "postings"])
+    periods = history["scraped_at"].dt.tz_localize(None).dt.to_period(freq).dt.start_time
+    postings = history.assign(period=periods).drop_duplicates(["period", "link"])
+    top = postings.drop_duplicates("link")["company"].value_counts().nlargest(top_n).index
+    counts = (postings[postings["company"].isin(top)]
+              .groupby(["period", "company"])
+              .size()
+              .rename("postings")
+              .reset_index())
+    return counts
+
+
+def title_frequency(history, top_n=15):
+    """Most common (case-folded) job titles among distinct postings."""
+    if history.empty:
+        return pd.DataFrame(columns=["title", "postings"])
+    titles = history.drop_duplicates("link")["title"].str.strip().str.title()
+    return titles.value_counts().nlargest(top_n).rename_axis("title").rename("postings").reset_index()
+
+
+def keyword_trends(history, top_n=8, freq="D"):
+    """Daily (or ``freq``) counts of the ``top_n`` title keywords across distinct postings."""
+    if history.empty:
+        return pd.DataFrame(columns=["period", "keyword", "postings"])
+    periods = history["scraped_at"].dt.tz_localize(None).dt.to_period(freq).dt.start_time
+    postings = history.assign(period=periods).drop_duplicates(["period", "link"])
+    keywords = (postings.assign(keyword=postings["title"].str.lower().str.findall(r"[a-z][a-z0-9+#.]*"))
+                .explode("keyword")
+                .dropna(subset=["keyword"]))
+    keywords = keywords[~keywords["keyword"].isin(TITLE_STOPWORDS)].drop_duplicates(["period", "link", "keyword"])
+    top = keywords["keyword"].value_counts().nlargest(top_n).index
+    return (keywords[keywords["keyword"].isin(top)]
+            .groupby(["period", "keyword"])
+            .size()
+            .rename("postings")
+            .reset_index())
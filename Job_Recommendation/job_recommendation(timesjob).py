@@ -1,8 +1,11 @@
+import os
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
 
+BASE_URL = os.environ.get("TIMESJOBS_BASE_URL", "https://www.timesjobs.com")
+
 
 
 job_name = input("Enter job name: ")
@@ -12,19 +15,19 @@ job_name_split = job_name.split()
 job_name_title = job_name.title()
 
 if(len(job_name_split) == 1):
-    url = f'https://www.timesjobs.com/candidate/job-search.html?searchType=personalizedSearch&from=submit&searchTextSrc=&searchTextText="{job_name_title}"&txtKeywords={job_name_split[0]}&txtLocation='
+    url = f'{BASE_URL}/candidate/job-search.html?searchType=personalizedSearch&from=submit&searchTextSrc=&searchTextText="{job_name_title}"&txtKeywords={job_name_split[0]}&txtLocation='
 
 elif(len(job_name_split) == 2):
-    url = f'https://www.timesjobs.com/candidate/job-search.html?searchType=personalizedSearch&from=submit&searchTextSrc=&searchTextText="{job_name_title}"&txtKeywords={job_name_split[0]}+{job_name_split[1]}&txtLocation='
+    url = f'{BASE_URL}/candidate/job-search.html?searchType=personalizedSearch&from=submit&searchTextSrc=&searchTextText="{job_name_title}"&txtKeywords={job_name_split[0]}+{job_name_split[1]}&txtLocation='
 
 elif(len(job_name_split) == 3):
-    url = f'https://www.timesjobs.com/candidate/job-search.html?searchType=personalizedSearch&from=submit&searchTextSrc=&searchTextText="{job_name_title}"&txtKeywords={job_name_split[0]}+{job_name_split[1]}+{job_name_split[2]}&txtLocation='
+    url = f'{BASE_URL}/candidate/job-search.html?searchType=personalizedSearch&from=submit&searchTextSrc=&searchTextText="{job_name_title}"&txtKeywords={job_name_split[0]}+{job_name_split[1]}+{job_name_split[2]}&txtLocation='
 
 elif(len(job_name_split) == 4):
-    url = f'https://www.timesjobs.com/candidate/job-search.html?searchType=personalizedSearch&from=submit&searchTextSrc=&searchTextText="{job_name_title}"&txtKeywords={job_name_split[0]}+{job_name_split[1]}+{job_name_split[2]}+{job_name_split[3]}&txtLocation='
+    url = f'{BASE_URL}/candidate/job-search.html?searchType=personalizedSearch&from=submit&searchTextSrc=&searchTextText="{job_name_title}"&txtKeywords={job_name_split[0]}+{job_name_split[1]}+{job_name_split[2]}+{job_name_split[3]}&txtLocation='
 
 elif(len(job_name_split) == 4):
-    url = f'https://www.timesjobs.com/candidate/job-search.html?searchType=personalizedSearch&from=submit&searchTextSrc=&searchTextText="{job_name_title}"&txtKeywords={job_name_split[0]}+{job_name_split[1]}+{job_name_split[2]}+{job_name_split[3]}+{job_name_split[4]}&txtLocation='
+    url = f'{BASE_URL}/candidate/job-search.html?searchType=personalizedSearch&from=submit&searchTextSrc=&searchTextText="{job_name_title}"&txtKeywords={job_name_split[0]}+{job_name_split[1]}+{job_name_split[2]}+{job_name_split[3]}+{job_name_split[4]}&txtLocation='
 
 response = requests.get(url)
 
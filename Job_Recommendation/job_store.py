@@ -0,0 +1,143 @@
+"""Persistent store of scraped TimesJobs postings.
+
+Postings are keyed by their URL. Each scrape only writes the rows that are
+new or whose content changed; unchanged postings just get their
+``last_seen`` time bumped. Looking up a page of links goes through the
+primary key, so refreshing a search costs the same however large the store
+grows. The dashboard reads search history straight from here, without
+scraping again.
+"""
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Shared"))
+from response_cache import cache_path, normalize_query
+
+HISTORY_COLUMNS = ["Job Title", "Company Name", "Link", "Posted", "First Seen", "Last Seen"]
+
+
+def _content_hash(record):
+    content = "\x1f".join([record["Job Title"], record["Company Name"], record.get("Posted", "")])
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+class JobStore:
+    """SQLite-backed job postings with first/last-seen bookkeeping."""
+
+    def __init__(self, db_path=None):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path or cache_path("jobs.sqlite"), check_same_thread=False)
+        self._db.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS jobs (
+                link TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                company TEXT,
+                posted TEXT,
+                content_hash TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS job_searches (
+                query TEXT NOT NULL,
+                link TEXT NOT NULL REFERENCES jobs (link),
+                last_seen REAL NOT NULL,
+                PRIMARY KEY (query, link)
+            );
+            CREATE INDEX IF NOT EXISTS job_searches_recent ON job_searches (query, last_seen);
+        """)
+
+    def upsert(self, records, query):
+        """Record one scrape of ``query``.
+
+        Returns ``{"new": n, "changed": n, "unchanged": n}``.
+        """
+        query = normalize_query(query)
+        now = time.time()
+        records = [record for record in records if record["Link"]]
+        links = [record["Link"] for record in records]
+        counts = {"new": 0, "changed": 0, "unchanged": 0}
+
+        with self._lock:
+            known = {}
+            if links:
+                placeholders = ", ".join("?" * len(links))
+                known = dict(self._db.execute(
+                    f"SELECT link, content_hash FROM jobs WHERE link IN ({placeholders})", links
+                ).fetchall())
+
+            inserts, updates, touches = [], [], []
+            for record in records:
+                digest = _content_hash(record)
+                link = record["Link"]
+                if link not in known:
+                    inserts.append((link, record["Job Title"], record["Company Name"],
+                                    record.get("Posted", ""), digest, now, now, now))
+                    counts["new"] += 1
+                elif known[link] != digest:
+                    updates.append((record["Job Title"], record["Company Name"],
+                                    record.get("Posted", ""), digest, now, now, link))
+                    counts["changed"] += 1
+                else:
+                    touches.append((now, link))
+                    counts["unchanged"] += 1
+
+            self._db.executemany("INSERT OR IGNORE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?)", inserts)
+            self._db.executemany("""
+                UPDATE jobs SET title = ?, company = ?, posted = ?, content_hash = ?,
+                    last_seen = ?, updated_at = ?
+                WHERE link = ?
+            """, updates)
+            self._db.executemany("UPDATE jobs SET last_seen = ? WHERE link = ?", touches)
+            self._db.executemany(
+                "INSERT OR REPLACE INTO job_searches VALUES (?, ?, ?)",
+                [(query, link, now) for link in links]
+            )
+            self._db.commit()
+        return counts
+
+    def first_seen(self, links):
+        """Map each known link to the time it was first scraped."""
+        if not links:
+            return {}
+        placeholders = ", ".join("?" * len(links))
+        with self._lock:
+            return dict(self._db.execute(
+                f"SELECT link, first_seen FROM jobs WHERE link IN ({placeholders})", list(links)
+            ).fetchall())
+
+    def queries(self):
+        """Stored search queries, most recently run first."""
+        with self._lock:
+            rows = self._db.execute("""
+                SELECT query FROM job_searches GROUP BY query ORDER BY MAX(last_seen) DESC
+            """).fetchall()
+        return [row[0] for row in rows]
+
+    def history(self, query, since=None, limit=500):
+        """Postings ever returned for ``query``, newest first, as a DataFrame."""
+        params = [normalize_query(query)]
+        since_sql = ""
+        if since is not None:
+            since_sql = "AND s.last_seen >= ?"
+            params.append(since)
+        params.append(limit)
+        with self._lock:
+            rows = self._db.execute(f"""
+                SELECT j.title, j.company, j.link, j.posted, j.first_seen, j.last_seen
+                FROM job_searches s JOIN jobs j ON j.link = s.link
+                WHERE s.query = ? {since_sql}
+                ORDER BY j.first_seen DESC
+                LIMIT ?
+            """, params).fetchall()
+        history = pd.DataFrame(rows, columns=HISTORY_COLUMNS)
+        for column in ("First Seen", "Last Seen"):
+            history[column] = pd.to_datetime(history[column], unit="s").dt.strftime("%Y-%m-%d %H:%M")
+        return history
@@ -0,0 +1,245 @@
+"""Bulk, resumable Coursera / TimesJobs pulls from the command line.
+
+Queries are read one per line from a file (or ``-`` for stdin), searched on a
+worker pool through the shared fetch scheduler and response cache, and each
+query's rows are streamed to the output as soon as it finishes::
+
+    python Shared/batch_scrape.py courses queries.txt -o courses.csv
+    python Shared/batch_scrape.py jobs - -o jobs_parquet --format parquet --resume
+
+CSV output is a single file. Parquet output is a directory of part files
+(readable as one dataset with ``pyarrow.dataset``), rolled every
+``--part-rows`` rows. Finished queries are journalled next to the output in
+``<output>.progress`` only once their rows are durable, so ``--resume`` skips
+them, drops any rows written after the last checkpoint and carries on.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from fetch_scheduler import get_scheduler
+from pagination import iter_result_pages
+from response_cache import ResponseCache, normalize_query
+from sources import (COURSERA_CARD, TIMESJOBS_CARD, coursera_page_url, coursera_search_url,
+                     parse_courses, parse_jobs, timesjobs_page_url, timesjobs_search_url)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# source -> (cache name, search URL, page URL, parser, card spec)
+SOURCES = {
+    "courses": ("coursera", coursera_search_url, coursera_page_url, parse_courses, COURSERA_CARD),
+    "jobs": ("timesjobs", timesjobs_search_url, timesjobs_page_url, parse_jobs, TIMESJOBS_CARD),
+}
+
+
+def read_queries(lines):
+    """Yield normalized, non-empty queries once each, in input order."""
+    seen = set()
+    for line in lines:
+        query = normalize_query(line)
+        if query and query not in seen:
+            seen.add(query)
+            yield query
+
+
+def search(source, query, max_results, client=None, cache=None):
+    """All records (up to ``max_results``) for one query, tagged with it; raises on failure."""
+    cache_name, search_url, page_url, parse, _ = SOURCES[source]
+    client = client or get_scheduler()
+    cache = cache or ResponseCache(cache_name)
+    url = search_url(query)
+    pages = iter_result_pages(
+        lambda page: cache.fetch(client, page),
+        lambda page: page_url(url, page),
+        lambda html: parse(html, limit=None),
+        max_results
+    )
+    return [dict(record, Query=query) for records in pages for record in records]
+
+
+class Progress:
+    """Append-only journal of finished queries and the checkpoint that covers them."""
+
+    def __init__(self, path, resume):
+        self.path = path
+        self.entries = []
+        if resume and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self.entries.append(json.loads(line))
+                    except ValueError:
+                        break  # torn last line from an interrupted write
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    @property
+    def done(self):
+        return {query for entry in self.entries for query in entry["queries"]}
+
+    def record(self, queries, **checkpoint):
+        entry = dict(checkpoint, queries=queries)
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.entries.append(entry)
+
+    def close(self):
+        self._file.close()
+
+
+class CsvSink:
+    """One CSV file; a checkpoint is the byte offset after a query's rows."""
+
+    def __init__(self, path, columns, progress):
+        self.progress = progress
+        offsets = [entry["offset"] for entry in progress.entries]
+        resuming = bool(offsets) and os.path.exists(path)
+        self._file = open(path, "r+" if resuming else "w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=columns, extrasaction="ignore")
+        if resuming:
+            # Anything past the last checkpoint belongs to a query that never finished.
+            self._file.seek(max(offsets))
+            self._file.truncate()
+        else:
+            self._writer.writeheader()
+
+    def write(self, query, records):
+        self._writer.writerows(records)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.progress.record([query], offset=self._file.tell())
+
+    def close(self):
+        self._file.close()
+
+
+class ParquetSink:
+    """Directory of Parquet parts; a query is checkpointed when its part is closed."""
+
+    def __init__(self, directory, columns, progress, part_rows=50_000):
+        if pq is None:
+            raise RuntimeError("Parquet output needs pyarrow (pip install pyarrow)")
+        self.directory = directory
+        self.progress = progress
+        self.part_rows = part_rows
+        self.schema = pa.schema([(column, pa.string()) for column in columns])
+        os.makedirs(directory, exist_ok=True)
+        committed = {entry["part"] for entry in progress.entries if entry["part"]}
+        for name in os.listdir(directory):
+            if name.endswith(".parquet") and name not in committed:
+                os.remove(os.path.join(directory, name))
+        self._next_part = len(committed)
+        self._writer = None
+        self._rows = 0
+        self._pending = []
+
+    def write(self, query, records):
+        if records:
+            if self._writer is None:
+                self._part = f"part-{self._next_part:05d}.parquet"
+                self._next_part += 1
+                self._writer = pq.ParquetWriter(os.path.join(self.directory, self._part), self.schema)
+            columns = {name: [record.get(name, "") for record in records] for name in self.schema.names}
+            self._writer.write_table(pa.table(columns, schema=self.schema))
+            self._rows += len(records)
+        self._pending.append(query)
+        if self._rows >= self.part_rows:
+            self._roll()
+
+    def _roll(self):
+        if self._writer is not None:
+            self._writer.close()
+            self.progress.record(self._pending, part=self._part)
+        elif self._pending:
+            # Queries with no rows at all still count as done.
+            self.progress.record(self._pending, part=None)
+        self._writer = None
+        self._rows = 0
+        self._pending = []
+
+    def close(self):
+        self._roll()
+
+
+def run(source, queries, sink, progress, max_results=20, workers=8, log=print):
+    """Search every query not already done, writing each result as it completes.
+
+    At most ``2 * workers`` queries are in flight, so arbitrarily long inputs
+    stream through in constant memory. Failed queries are logged and left out
+    of the journal so a later ``--resume`` retries them.
+    """
+    done = progress.done
+    client = get_scheduler()
+    cache = ResponseCache(SOURCES[source][0])
+    written = failed = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight = {}
+        queries = (query for query in queries if query not in done)
+        while True:
+            for query in queries:
+                in_flight[executor.submit(search, source, query, max_results, client, cache)] = query
+                if len(in_flight) >= 2 * workers:
+                    break
+            if not in_flight:
+                break
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                query = in_flight.pop(future)
+                try:
+                    records = future.result()
+                except Exception as e:
+                    failed += 1
+                    log(f"{query!r}: {e}")
+                    continue
+                sink.write(query, records)
+                written += len(records)
+                log(f"{query!r}: {len(records)} rows")
+    return written, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-scrape course or job search results.")
+    parser.add_argument("source", choices=sorted(SOURCES), help="what to search for")
+    parser.add_argument("queries", help="file with one query per line, or - for stdin")
+    parser.add_argument("-o", "--output", required=True, help="CSV file, or directory for Parquet parts")
+    parser.add_argument("--format", choices=["csv", "parquet"],
+                        help="output format (default: from the output's extension, else csv)")
+    parser.add_argument("--max-results", type=int, default=20, help="results per query (default: 20)")
+    parser.add_argument("--workers", type=int, default=8, help="queries searched at once (default: 8)")
+    parser.add_argument("--part-rows", type=int, default=50_000,
+                        help="rows per Parquet part file (default: 50000)")
+    parser.add_argument("--resume", action="store_true", help="skip queries finished by an earlier run")
+    args = parser.parse_args()
+
+    output_format = args.format or ("parquet" if args.output.endswith(".parquet") else "csv")
+    columns = ["Query"] + SOURCES[args.source][4].columns
+    progress = Progress(args.output.rstrip(os.sep) + ".progress", args.resume)
+    if output_format == "parquet":
+        sink = ParquetSink(args.output, columns, progress, args.part_rows)
+    else:
+        sink = CsvSink(args.output, columns, progress)
+
+    source = sys.stdin if args.queries == "-" else open(args.queries, encoding="utf-8")
+    log = lambda message: print(message, file=sys.stderr)
+    try:
+        written, failed = run(args.source, read_queries(source), sink, progress,
+                              args.max_results, args.workers, log)
+    finally:
+        sink.close()
+        progress.close()
+        if source is not sys.stdin:
+            source.close()
+    log(f"Wrote {written} rows; {failed} queries failed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
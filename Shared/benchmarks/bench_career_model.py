@@ -0,0 +1,100 @@
+"""Cold start, memory and latency of the career classifier.
+
+Each scenario runs in a fresh interpreter so import costs are counted, and
+reports wall time to the first prediction plus the process's peak RSS. The
+"legacy" scenario is the import block the Career Guidance pages had before
+the NumPy model (TensorFlow, Keras, scikit-learn); it is skipped when those
+packages aren't installed. Usage::
+
+    python Shared/benchmarks/bench_career_model.py --repeat 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CAREER_DIR = os.path.abspath(os.path.join(HERE, os.pardir, os.pardir, "Career_Guidance"))
+
+_REPORT = """
+import json, resource, sys, time
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+# ru_maxrss is KiB on Linux, bytes on macOS.
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+print(json.dumps({{"seconds": elapsed, "rss": rss}}))
+"""
+
+SCENARIOS = {
+    "legacy imports (tensorflow + sklearn)": """
+import numpy as np
+from sklearn.preprocessing import LabelEncoder
+from sklearn.model_selection import train_test_split
+from tensorflow.keras.models import Sequential
+from tensorflow.keras.layers import Dense
+from tensorflow.keras.callbacks import EarlyStopping
+import pickle
+""",
+    "legacy imports, scikit-learn part only": """
+import numpy as np
+from sklearn.preprocessing import LabelEncoder
+from sklearn.model_selection import train_test_split
+import pickle
+""",
+    "numpy model: import, load, first prediction": f"""
+sys.path.insert(0, {CAREER_DIR!r})
+from career_model import load_model
+model = load_model()
+model.predict(["Beginner"] * len(model.fields))
+""",
+}
+
+
+def run_scenario(body, repeat):
+    timings, peaks = [], []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", _REPORT.format(body=body)],
+                                capture_output=True, text=True)
+        if result.returncode:
+            return None
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(report["seconds"])
+        peaks.append(report["rss"])
+    return statistics.median(timings), max(peaks)
+
+
+def bench_latency(repeat):
+    sys.path.insert(0, CAREER_DIR)
+    from career_model import load_model
+    model = load_model()
+    features = model.encode(["Beginner"] * len(model.fields))
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model.top_k(features, 3)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark career classifier cold start and latency.")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per scenario (default: 5)")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<48}{'cold ms':>10}{'peak RSS MiB':>14}")
+    for name, body in SCENARIOS.items():
+        result = run_scenario(body, args.repeat)
+        if result is None:
+            print(f"{name:<48}{'skipped (not installed)':>24}")
+            continue
+        seconds, rss = result
+        print(f"{name:<48}{seconds * 1000:>10.1f}{rss / 2 ** 20:>14.1f}")
+    print(f"\nwarm single prediction: {bench_latency(1000) * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare the card extraction engine with the original per-column parsers.
+
+Runs both against the saved search pages in ``fixtures/`` and prints the
+median time per page. Usage::
+
+    python Shared/benchmarks/bench_extraction.py --repeat 50
+"""
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, os.pardir))
+from sources import parse_courses, parse_jobs
+
+FIXTURES = os.path.join(HERE, "fixtures")
+
+
+def legacy_parse_courses(html):
+    # Verbatim from coursefinder.get_course_data before the extraction engine.
+    soup = BeautifulSoup(html, "html.parser")
+    educators_list = [educator.text for educator in
+                      soup.find_all("p", class_="cds-ProductCard-partnerNames css-vac8rf")[:5]]
+    course_titles_list = [title.text for title in soup.find_all("h3", class_="cds-CommonCard-title css-6ecy9b")[:5]]
+    skills_list = [skill.text for skill in soup.find_all("div", class_="cds-CommonCard-bodyContent")[:5]]
+    ratings = soup.find_all("div", class_="cds-RatingStat-meter")
+    ratings_list = [rate.text.split("Rating")[0].strip() for rate in ratings[:5]]
+    hyperlinks_list = ["https://www.coursera.org" + hyperlink["href"] for hyperlink in
+                       soup.find_all("a",
+                                     class_="cds-119 cds-113 cds-115 cds-CommonCard-titleLink css-vflzcf cds-142")[
+                       :5]]
+    levels_list = [level.text.split()[0] for level in soup.find_all("div", class_="cds-CommonCard-metadata")[:5]]
+    images_div = soup.find_all("img")
+    images_list = []
+    for i in images_div[5:10]:
+        if 'src' in i.attrs:
+            images_list.append(i['src'])
+        else:
+            images_list.append('')
+    return list(zip(course_titles_list, educators_list, skills_list, ratings_list,
+                    hyperlinks_list, levels_list, images_list))
+
+
+def legacy_parse_jobs(html):
+    # Verbatim from jobSearch.scrape_jobs before the extraction engine.
+    soup = BeautifulSoup(html, "lxml")
+    job_titles_list = []
+    job_titles = soup.find_all("h2", class_="heading-trun")
+    for job_title in job_titles[:5]:
+        job_titles_list.append(job_title["title"])
+    company_names_list = []
+    company_names = soup.find_all("h3", class_="joblist-comp-name")
+    for company_name in company_names[:5]:
+        company_name = company_name.text
+        cleaned_company_name = re.sub(r'\s+', ' ', company_name).strip()
+        company_names_list.append(cleaned_company_name)
+    hyperlinks_list = []
+    hyperlinks = soup.find_all("a", class_="posoverlay_srp")
+    for hyperlink in hyperlinks[:5]:
+        hyperlinks_list.append(hyperlink["href"])
+    return list(zip(job_titles_list, company_names_list, hyperlinks_list))
+
+
+def time_parser(parser, html, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser(html)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per parser (default: 20)")
+    args = parser.parse_args()
+
+    cases = [
+        ("coursera_search.html", legacy_parse_courses, parse_courses),
+        ("timesjobs_search.html", legacy_parse_jobs, parse_jobs),
+    ]
+    print(f"{'fixture':<24}{'legacy ms':>12}{'engine ms':>12}{'speedup':>10}")
+    for fixture, legacy, engine in cases:
+        with open(os.path.join(FIXTURES, fixture), encoding="utf-8") as f:
+            html = f.read()
+        legacy_time = time_parser(legacy, html, args.repeat)
+        engine_time = time_parser(engine, html, args.repeat)
+        print(f"{fixture:<24}{legacy_time * 1000:>12.2f}{engine_time * 1000:>12.2f}"
+              f"{legacy_time / engine_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""Benchmark the scraping subsystem against recorded pages, offline.
+
+A local HTTP stand-in replays the fixtures in ``fixtures/`` (with per-page
+variations so pagination sees fresh results) and both sources are pointed at
+it through ``COURSERA_BASE_URL`` / ``TIMESJOBS_BASE_URL``. Three groups of
+measurements are reported:
+
+* stages: fetch, parse, DataFrame build and CSV export, timed separately,
+  with peak traced memory and pages per second;
+* pages: ``coursefinder.get_course_data`` and ``jobSearch.scrape_jobs`` end
+  to end, with a cold and a warm response cache;
+* CLI: the two single-query scripts, run as subprocesses.
+
+Usage::
+
+    python Shared/benchmarks/run_benchmarks.py --pages 10 --json before.json
+    python Shared/benchmarks/run_benchmarks.py --pages 10 --compare before.json
+"""
+import argparse
+import http.server
+import importlib
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from urllib.parse import parse_qs, urlparse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.abspath(os.path.join(HERE, os.pardir, os.pardir))
+FIXTURES = os.path.join(HERE, "fixtures")
+
+
+def _read_fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class FixtureHandler(http.server.BaseHTTPRequestHandler):
+    """Serves the Coursera or TimesJobs fixture depending on the request path."""
+
+    pages = {}
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        if url.path == "/search":
+            page = int(params.get("page", ["1"])[0])
+            body = self.pages["coursera"].replace("/learn/", f"/learn/p{page}-")
+        elif url.path == "/candidate/job-search.html":
+            page = int(params.get("sequence", ["1"])[0])
+            body = self.pages["timesjobs"].replace("jobid-", f"jobid-{page}0")
+        else:
+            self.send_error(404)
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """Local stand-in for coursera.org and timesjobs.com, run on a daemon thread."""
+
+    def __enter__(self):
+        FixtureHandler.pages = {
+            "coursera": _read_fixture("coursera_search.html"),
+            "timesjobs": _read_fixture("timesjobs_search.html"),
+        }
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def measure(func, repeat):
+    """Median wall time of ``func`` over ``repeat`` runs, plus peak traced memory of one run."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, statistics.median(timings), peak
+
+
+def bench_stages(results, pages, repeat):
+    import pandas as pd
+    import requests
+    from sources import (COURSERA_CARD, TIMESJOBS_CARD, coursera_search_url, parse_courses,
+                         parse_jobs, timesjobs_search_url)
+
+    session = requests.Session()
+    sources = [
+        ("coursera", lambda page: coursera_search_url("python", page), parse_courses, COURSERA_CARD),
+        ("timesjobs", lambda page: timesjobs_search_url("data scientist", page), parse_jobs, TIMESJOBS_CARD),
+    ]
+    for source, search_url, parse, card in sources:
+        urls = [search_url(page) for page in range(1, pages + 1)]
+        html_pages, fetch_time, fetch_peak = measure(lambda: [session.get(url).text for url in urls], repeat)
+        records, parse_time, parse_peak = measure(
+            lambda: [record for html in html_pages for record in parse(html, limit=None)], repeat
+        )
+        frame, frame_time, frame_peak = measure(lambda: pd.DataFrame(records, columns=card.columns), repeat)
+        _, csv_time, csv_peak = measure(lambda: frame.to_csv(index=False), repeat)
+        for stage, seconds, peak in [("fetch", fetch_time, fetch_peak), ("parse", parse_time, parse_peak),
+                                     ("dataframe", frame_time, frame_peak), ("csv", csv_time, csv_peak)]:
+            results[f"stage/{source}/{stage}"] = {
+                "seconds": seconds,
+                "peak_bytes": peak,
+                "pages_per_second": pages / seconds if seconds else float("inf"),
+            }
+
+
+def _import_page(directory, module_name):
+    sys.path.insert(0, os.path.join(ROOT, directory))
+    import streamlit.logger
+    streamlit.logger.set_log_level("error")
+    return importlib.import_module(module_name)
+
+
+def bench_pages(results, pages, repeat):
+    coursefinder = _import_page("Course_Recommendation", "coursefinder")
+    job_search = _import_page("Job_Recommendation", "jobSearch")
+    cases = [
+        ("coursefinder.get_course_data", coursefinder,
+         lambda: coursefinder.get_course_data(coursefinder.create_search_url("python"), max_results=pages * 24)),
+        ("jobSearch.scrape_jobs", job_search,
+         lambda: job_search.scrape_jobs(job_search.create_search_url("data scientist"), max_results=pages * 25)),
+    ]
+    for name, module, run in cases:
+        cache = module.get_response_cache()
+
+        def cold():
+            cache.clear()
+            return run()
+
+        frame, cold_time, cold_peak = measure(cold, repeat)
+        _, warm_time, warm_peak = measure(run, repeat)
+        fetched_pages = -(-len(frame) // (24 if "course" in name else 25))
+        results[f"page/{name}/cold"] = {
+            "seconds": cold_time,
+            "peak_bytes": cold_peak,
+            "pages_per_second": fetched_pages / cold_time,
+        }
+        results[f"page/{name}/warm"] = {
+            "seconds": warm_time,
+            "peak_bytes": warm_peak,
+            "pages_per_second": fetched_pages / warm_time,
+        }
+
+
+def bench_cli(results, repeat, env):
+    scripts = [
+        ("Course_Recommendation/course_recommendation(coursera).py", "python\n"),
+        ("Job_Recommendation/job_recommendation(timesjob).py", "data scientist\n"),
+    ]
+    for script, answer in scripts:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, os.path.join(ROOT, script)], input=answer, text=True,
+                           env=env, check=True, stdout=subprocess.DEVNULL)
+            timings.append(time.perf_counter() - start)
+        # ru_maxrss is the largest child so far (KiB on Linux), a good enough upper bound here.
+        peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * 1024
+        seconds = statistics.median(timings)
+        results[f"cli/{os.path.basename(script)}"] = {
+            "seconds": seconds,
+            "peak_bytes": peak,
+            "pages_per_second": 1 / seconds,
+        }
+
+
+def print_report(results, baseline=None):
+    header = f"{'benchmark':<48}{'ms':>10}{'peak MiB':>10}{'pages/s':>10}"
+    if baseline:
+        header += f"{'vs base':>10}"
+    print(header)
+    for name, result in results.items():
+        line = (f"{name:<48}{result['seconds'] * 1000:>10.2f}{result['peak_bytes'] / 2 ** 20:>10.2f}"
+                f"{result['pages_per_second']:>10.1f}")
+        if baseline and name in baseline:
+            line += f"{baseline[name]['seconds'] / result['seconds']:>9.2f}x"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the scrapers against recorded pages.")
+    parser.add_argument("--pages", type=int, default=5, help="result pages per search (default: 5)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark (default: 5)")
+    parser.add_argument("--skip-cli", action="store_true", help="skip the subprocess CLI benchmarks")
+    parser.add_argument("--json", help="write results to this file for later comparison")
+    parser.add_argument("--compare", help="baseline JSON from an earlier --json run")
+    args = parser.parse_args()
+
+    with FixtureServer() as server, tempfile.TemporaryDirectory() as cache_dir:
+        # Must be set before the shared modules are imported: they read it at import time.
+        os.environ["COURSERA_BASE_URL"] = server.base_url
+        os.environ["TIMESJOBS_BASE_URL"] = server.base_url
+        os.environ["CAREERTRACK_CACHE_DIR"] = cache_dir
+        sys.path.insert(0, os.path.join(HERE, os.pardir))
+
+        results = {}
+        bench_stages(results, args.pages, args.repeat)
+        bench_pages(results, args.pages, args.repeat)
+        if not args.skip_cli:
+            bench_cli(results, args.repeat, dict(os.environ))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""Local full-text index of Coursera courses.
+
+An offline ingestion job crawls search result pages into a SQLite table with
+an FTS5 index over title, educator, skills and level, so Course Finder can
+answer most searches in milliseconds without touching coursera.org::
+
+    python Shared/course_index.py ingest queries.txt --pages 3
+
+``queries.txt`` holds one search term per line; ``-`` reads them from stdin.
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+import pandas as pd
+import requests
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from fetch_scheduler import get_scheduler
+from response_cache import ResponseCache, cache_path, normalize_query
+from sources import COURSERA_CARD, coursera_search_url, parse_courses
+
+# Column weights for bm25(): a hit in the title counts most, then skills.
+BM25_WEIGHTS = (10.0, 2.0, 5.0, 1.0)
+
+
+def _parse_rating(rating):
+    try:
+        return float(rating)
+    except (TypeError, ValueError):
+        return None
+
+
+def to_match_expression(query):
+    """Turn free text into an FTS5 query: every term required, last one as a prefix."""
+    terms = [term.replace('"', '""') for term in normalize_query(query).split()]
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+class CourseIndex:
+    """SQLite FTS5 index of course cards keyed by course link."""
+
+    def __init__(self, db_path=None):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path or cache_path("courses.sqlite"), check_same_thread=False)
+        self._db.executescript("""
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS courses (
+                id INTEGER PRIMARY KEY,
+                link TEXT NOT NULL UNIQUE,
+                title TEXT NOT NULL,
+                educator TEXT,
+                skills TEXT,
+                level TEXT,
+                rating REAL,
+                image TEXT,
+                indexed_at REAL NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts USING fts5(
+                title, educator, skills, level,
+                content='courses', content_rowid='id', tokenize='porter unicode61'
+            );
+            CREATE TRIGGER IF NOT EXISTS courses_ai AFTER INSERT ON courses BEGIN
+                INSERT INTO courses_fts(rowid, title, educator, skills, level)
+                VALUES (new.id, new.title, new.educator, new.skills, new.level);
+            END;
+            CREATE TRIGGER IF NOT EXISTS courses_ad AFTER DELETE ON courses BEGIN
+                INSERT INTO courses_fts(courses_fts, rowid, title, educator, skills, level)
+                VALUES ('delete', old.id, old.title, old.educator, old.skills, old.level);
+            END;
+            CREATE TRIGGER IF NOT EXISTS courses_au AFTER UPDATE ON courses BEGIN
+                INSERT INTO courses_fts(courses_fts, rowid, title, educator, skills, level)
+                VALUES ('delete', old.id, old.title, old.educator, old.skills, old.level);
+                INSERT INTO courses_fts(rowid, title, educator, skills, level)
+                VALUES (new.id, new.title, new.educator, new.skills, new.level);
+            END;
+            CREATE TABLE IF NOT EXISTS indexed_queries (
+                query TEXT PRIMARY KEY,
+                indexed_at REAL NOT NULL
+            );
+        """)
+
+    def add(self, records):
+        """Insert or refresh course records as returned by ``parse_courses``."""
+        now = time.time()
+        rows = [
+            (record["Link"], record["Course Title"], record["Educator"], record["Skills"],
+             record["Level"], _parse_rating(record["Rating"]), record["Images Link"], now)
+            for record in records if record["Link"] and record["Course Title"]
+        ]
+        with self._lock:
+            self._db.executemany("""
+                INSERT INTO courses (link, title, educator, skills, level, rating, image, indexed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(link) DO UPDATE SET
+                    title = excluded.title, educator = excluded.educator, skills = excluded.skills,
+                    level = excluded.level, rating = excluded.rating, image = excluded.image,
+                    indexed_at = excluded.indexed_at
+            """, rows)
+            self._db.commit()
+        return len(rows)
+
+    def mark_indexed(self, query):
+        """Record that Coursera's results for ``query`` were crawled into the index."""
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO indexed_queries VALUES (?, ?)",
+                             (normalize_query(query), time.time()))
+            self._db.commit()
+
+    def has_query(self, query):
+        """Whether ``query`` itself was crawled, not just matched by other searches' courses."""
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM indexed_queries WHERE query = ?",
+                                    (normalize_query(query),)).fetchone() is not None
+
+    def count(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM courses").fetchone()[0]
+
+    def last_updated(self):
+        """When the catalog last changed; a cheap key for caching anything built from it."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*), MAX(indexed_at) FROM courses").fetchone()
+
+    def catalog(self):
+        """Every indexed course in Course Finder's columns."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT title, educator, skills, rating, link, level, image FROM courses ORDER BY id"
+            ).fetchall()
+        catalog = pd.DataFrame(rows, columns=COURSERA_CARD.columns)
+        catalog["Rating"] = catalog["Rating"].map(lambda rating: "" if pd.isna(rating) else f"{rating:.1f}")
+        return catalog
+
+    def levels(self):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT DISTINCT level FROM courses WHERE level != '' ORDER BY level"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def search(self, query, level=None, min_rating=None, page=1, per_page=10):
+        """Rank matching courses by bm25 (rating breaks ties).
+
+        Returns ``(DataFrame, total)`` where the frame holds one page of
+        results in Course Finder's columns and ``total`` counts every match.
+        """
+        expression = to_match_expression(query)
+        if expression is None:
+            return pd.DataFrame(columns=COURSERA_CARD.columns), 0
+
+        where = ["courses_fts MATCH ?"]
+        params = [expression]
+        if level:
+            where.append("c.level = ?")
+            params.append(level)
+        if min_rating:
+            where.append("c.rating >= ?")
+            params.append(min_rating)
+        where_sql = " AND ".join(where)
+
+        with self._lock:
+            total = self._db.execute(f"""
+                SELECT COUNT(*) FROM courses_fts JOIN courses c ON c.id = courses_fts.rowid
+                WHERE {where_sql}
+            """, params).fetchone()[0]
+            rows = self._db.execute(f"""
+                SELECT c.title, c.educator, c.skills, c.rating, c.link, c.level, c.image
+                FROM courses_fts JOIN courses c ON c.id = courses_fts.rowid
+                WHERE {where_sql}
+                ORDER BY bm25(courses_fts, ?, ?, ?, ?), c.rating DESC
+                LIMIT ? OFFSET ?
+            """, params + list(BM25_WEIGHTS) + [per_page, (page - 1) * per_page]).fetchall()
+
+        results = pd.DataFrame(rows, columns=COURSERA_CARD.columns)
+        results["Rating"] = results["Rating"].map(lambda rating: "" if pd.isna(rating) else f"{rating:.1f}")
+        return results, total
+
+
+def ingest(index, queries, pages=3, client=None, log=print):
+    """Crawl ``pages`` result pages per query into ``index``."""
+    client = client or get_scheduler()
+    cache = ResponseCache("coursera")
+    for query in queries:
+        query = normalize_query(query)
+        added = 0
+        for page in range(1, pages + 1):
+            try:
+                html = cache.fetch(client, coursera_search_url(query, page))
+            except requests.RequestException as e:
+                log(f"{query!r} page {page}: {e}")
+                break
+            records = parse_courses(html, limit=None)
+            if not records:
+                break
+            added += index.add(records)
+        if added:
+            index.mark_indexed(query)
+        log(f"{query!r}: indexed {added} courses")
+    return index.count()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the local Coursera course index.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    ingest_parser = subparsers.add_parser("ingest", help="crawl search pages into the index")
+    ingest_parser.add_argument("queries", help="file with one search term per line, or - for stdin")
+    ingest_parser.add_argument("--pages", type=int, default=3, help="result pages per query (default: 3)")
+    ingest_parser.add_argument("--db", help="index path (default: the CareerTrack cache directory)")
+    args = parser.parse_args()
+
+    if args.queries == "-":
+        queries = [line for line in sys.stdin if line.strip()]
+    else:
+        with open(args.queries, encoding="utf-8") as f:
+            queries = [line for line in f if line.strip()]
+    total = ingest(CourseIndex(args.db), queries, pages=args.pages)
+    print(f"Index holds {total} courses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Single-pass, card-oriented extraction for search result pages.
+
+Instead of one ``find_all`` sweep over the whole document per column, a
+``CardSpec`` names the element that wraps each result and the fields inside
+it. The parser only builds the subtrees for those cards (via ``SoupStrainer``)
+and every field of a card is filled during one walk over its descendants, so
+a card that lacks a field gets a default instead of shifting the columns of
+every card after it.
+"""
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+
+class Field:
+    """A value read from the first element in a card matching ``tag``/``css_class``."""
+
+    def __init__(self, name, tag, css_class=None, attr=None, clean=None, default=""):
+        self.name = name
+        self.tag = tag
+        self.css_class = css_class
+        self.attr = attr
+        self.clean = clean
+        self.default = default
+
+    def matches(self, element):
+        if element.name != self.tag:
+            return False
+        if self.attr and not element.get(self.attr):
+            return False
+        return self.css_class is None or self.css_class in element.get("class", ())
+
+    def value(self, element):
+        raw = element.get(self.attr) if self.attr else element.get_text()
+        return self.clean(raw) if self.clean else raw
+
+
+class CardSpec:
+    """The element wrapping one search result and the fields to read from it."""
+
+    def __init__(self, tag, css_class, fields):
+        self.tag = tag
+        self.css_class = css_class
+        self.fields = fields
+
+    @property
+    def columns(self):
+        return [field.name for field in self.fields]
+
+    def has_card_class(self, value):
+        # While the document is being strained the class attribute is still
+        # the raw string, so match on its tokens rather than the whole value.
+        if value is None:
+            return False
+        tokens = value.split() if isinstance(value, str) else value
+        return self.css_class in tokens
+
+    def strainer(self):
+        return SoupStrainer(self.tag, class_=self.has_card_class)
+
+
+def extract_card(card, spec):
+    """Fill every field of ``spec`` from one card in a single descendant walk."""
+    record = {}
+    pending = list(spec.fields)
+    for element in card.descendants:
+        if element.name is None:
+            continue
+        matched = [field for field in pending if field.matches(element)]
+        for field in matched:
+            record[field.name] = field.value(element)
+            pending.remove(field)
+        if not pending:
+            break
+    for field in pending:
+        record[field.name] = field.default
+    return record
+
+
+def extract_cards(html, spec, limit=None):
+    """Parse ``html`` once and return one dict per result card, in page order."""
+    soup = BeautifulSoup(html, PARSER, parse_only=spec.strainer())
+    cards = soup.find_all(spec.tag, class_=spec.css_class, limit=limit)
+    return [extract_card(card, spec) for card in cards]
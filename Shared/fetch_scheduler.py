@@ -0,0 +1,194 @@
+"""Process-wide, polite HTTP fetch scheduler shared by the scrapers.
+
+Every Streamlit session in the process feeds one request queue. A fixed pool
+of workers drains it, and before each request a worker takes a token from
+the target host's bucket and one of the host's concurrency slots. Timeouts
+are always set. Connection errors, ``429`` and ``5xx`` responses are retried
+a bounded number of times with jittered exponential backoff. ``Retry-After``
+is honoured by pausing the whole host, not just the one request, so the
+process keeps to the highest rate the upstream accepts instead of failing.
+A ``Retry-After`` longer than ``backoff_cap`` is not waited out, since that
+would tie up a shared worker: the response is returned at once.
+
+``FetchScheduler.get`` mirrors ``requests.get``, so the scheduler can be
+passed anywhere a session is expected (e.g. ``ResponseCache.fetch``).
+"""
+import email.utils
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# (requests per second, burst, concurrent requests) per upstream host. Hosts
+# not listed here are only bounded by the worker pool.
+HOST_LIMITS = {
+    "www.coursera.org": (2.0, 4, 4),
+    "www.timesjobs.com": (1.0, 3, 4),
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Classic token bucket; ``pause`` empties it until a point in time."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._paused_until:
+                    self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                else:
+                    wait = self._paused_until - now
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+            self._updated = self._paused_until
+
+
+class _Host:
+    def __init__(self, limits):
+        rate, burst, concurrency = limits
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.slots = threading.BoundedSemaphore(concurrency) if concurrency else None
+
+
+def _retry_after(response):
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class FetchScheduler:
+    """Queue of GET requests served by a worker pool under per-host limits."""
+
+    def __init__(self, workers=8, host_limits=None, max_retries=3, backoff_base=0.5,
+                 backoff_cap=30.0, timeout=(5, 30), headers=None):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.timeout = timeout
+        self.host_limits = HOST_LIMITS if host_limits is None else host_limits
+        self._hosts = {}
+        self._hosts_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._session = requests.Session()
+        self._session.headers.update(DEFAULT_HEADERS if headers is None else headers)
+        adapter = HTTPAdapter(pool_connections=max(len(self.host_limits), 4), pool_maxsize=workers)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        for _ in range(workers):
+            threading.Thread(target=self._work, daemon=True).start()
+
+    def submit(self, url, headers=None, timeout=None):
+        """Queue a GET and return a ``Future`` resolving to the ``requests.Response``."""
+        future = Future()
+        self._queue.put((future, url, headers, timeout or self.timeout))
+        return future
+
+    def get(self, url, headers=None, timeout=None, **kwargs):
+        """Blocking, ``requests.get``-compatible wrapper around :meth:`submit`."""
+        return self.submit(url, headers, timeout).result()
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def _host(self, url):
+        netloc = urlparse(url).netloc
+        with self._hosts_lock:
+            if netloc not in self._hosts:
+                self._hosts[netloc] = _Host(self.host_limits.get(netloc, (None, None, None)))
+            return self._hosts[netloc]
+
+    def _work(self):
+        while True:
+            future, url, headers, timeout = self._queue.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self._fetch(url, headers, timeout))
+                except Exception as e:
+                    future.set_exception(e)
+            self._queue.task_done()
+
+    def _backoff(self, attempt):
+        # "Full jitter": a uniform delay up to the exponential ceiling.
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def _fetch(self, url, headers, timeout):
+        host = self._host(url)
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            if host.bucket:
+                host.bucket.acquire()
+            if host.slots:
+                host.slots.acquire()
+            try:
+                response = self._session.get(url, headers=headers, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                if last_attempt:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if response.status_code not in RETRY_STATUSES or last_attempt:
+                    return response
+                delay = _retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                elif delay > self.backoff_cap:
+                    if host.bucket:
+                        host.bucket.pause(self.backoff_cap)
+                    return response
+                elif host.bucket:
+                    # The next acquire() waits out the pause; don't sleep on top of it.
+                    host.bucket.pause(delay)
+                    delay = 0
+            finally:
+                if host.slots:
+                    host.slots.release()
+            time.sleep(delay)
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """The process-wide scheduler, created on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = FetchScheduler()
+        return _scheduler
@@ -0,0 +1,30 @@
+"""Lazily walk the result pages of a search.
+
+Scrapers wrap :func:`iter_result_pages` so callers can render each page the
+moment it is parsed instead of waiting for the whole result set.
+"""
+
+# Hard stop for runaway pagination (e.g. a site that repeats its last page
+# forever would otherwise be caught only by the duplicate check below).
+MAX_PAGES = 50
+
+
+def iter_result_pages(fetch, page_url, parse, max_results, key="Link"):
+    """Yield lists of records, one list per result page, until ``max_results``.
+
+    ``page_url(n)`` builds the URL of 1-based page ``n``, ``fetch(url)``
+    returns its HTML and ``parse(html)`` its records. Records already seen on
+    an earlier page are dropped; a page with nothing new ends the walk.
+    """
+    seen = set()
+    remaining = max_results
+    for page in range(1, MAX_PAGES + 1):
+        if remaining <= 0:
+            return
+        records = [record for record in parse(fetch(page_url(page))) if record[key] not in seen]
+        if not records:
+            return
+        records = records[:remaining]
+        seen.update(record[key] for record in records)
+        remaining -= len(records)
+        yield records
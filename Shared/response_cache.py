@@ -0,0 +1,184 @@
+"""Two-tier response cache shared by the Coursera and TimesJobs scrapers.
+
+Search pages are keyed on their URL, which the scrapers build from a
+normalized query, so "Python", " python " and "PYTHON" share one entry. An
+in-process LRU sits in front of a SQLite store that survives Streamlit reruns
+and restarts. Each source has its own TTL; once an entry goes stale it is
+revalidated with ``If-None-Match`` / ``If-Modified-Since`` before anything is
+downloaded again.
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+CACHE_DIR = os.environ.get(
+    "CAREERTRACK_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "careertrack")
+)
+
+# Seconds before a cached search page must be revalidated upstream.
+SOURCE_TTLS = {
+    "coursera": 12 * 60 * 60,
+    "timesjobs": 60 * 60,
+}
+
+# Memory-tier hits are written back to SQLite's ``accessed_at`` in batches,
+# at most this many seconds apart, so the disk LRU keeps hot entries.
+TOUCH_FLUSH_SECONDS = 30
+
+CacheEntry = namedtuple("CacheEntry", ["body", "etag", "last_modified", "fetched_at"])
+
+
+def cache_path(filename):
+    """Return ``filename`` inside the cache directory, creating the directory."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, filename)
+
+
+def normalize_query(query):
+    """Lower-case a search query and collapse its whitespace."""
+    return " ".join(query.lower().split())
+
+
+class ResponseCache:
+    """LRU + SQLite cache of response bodies for a single source."""
+
+    def __init__(self, source, ttl=None, db_path=None, max_entries=1000,
+                 max_bytes=64 * 1024 * 1024, memory_entries=128):
+        self.source = source
+        self.ttl = SOURCE_TTLS.get(source, 60 * 60) if ttl is None else ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._touched = {}
+        self._flushed_at = time.time()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path or cache_path("responses.sqlite"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                source TEXT NOT NULL,
+                key TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL,
+                PRIMARY KEY (source, key)
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (source, accessed_at)")
+        self._db.commit()
+
+    def is_fresh(self, entry):
+        return time.time() - entry.fetched_at < self.ttl
+
+    def get(self, key):
+        """Return the cached entry for ``key`` (fresh or stale), or ``None``."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self._touched[key] = time.time()
+                if time.time() - self._flushed_at >= TOUCH_FLUSH_SECONDS:
+                    self._flush_touches()
+                    self._db.commit()
+                return entry
+            row = self._db.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE source = ? AND key = ?",
+                (self.source, key)
+            ).fetchone()
+            if row is None:
+                return None
+            entry = CacheEntry(row[0].decode("utf-8"), row[1], row[2], row[3])
+            self._db.execute(
+                "UPDATE responses SET accessed_at = ? WHERE source = ? AND key = ?",
+                (time.time(), self.source, key)
+            )
+            self._db.commit()
+            self._remember(key, entry)
+            return entry
+
+    def put(self, key, body, etag=None, last_modified=None):
+        now = time.time()
+        entry = CacheEntry(body, etag, last_modified, now)
+        data = body.encode("utf-8")
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (self.source, key, data, etag, last_modified, now, now, len(data))
+            )
+            self._evict()
+            self._db.commit()
+            self._remember(key, entry)
+        return entry
+
+    def clear(self):
+        """Drop every entry for this source from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._touched.clear()
+            self._db.execute("DELETE FROM responses WHERE source = ?", (self.source,))
+            self._db.commit()
+
+    def fetch(self, client, url, **kwargs):
+        """Return the body of ``url``, going upstream only when the cache can't answer.
+
+        ``client`` is anything with a ``requests``-style ``get`` method. A stale
+        entry is revalidated with its validators; a ``304`` simply renews it.
+        """
+        entry = self.get(url)
+        if entry is not None and self.is_fresh(entry):
+            return entry.body
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        response = client.get(url, headers=headers, **kwargs)
+        if entry is not None and response.status_code == 304:
+            return self.put(url, entry.body, entry.etag, entry.last_modified).body
+        response.raise_for_status()
+        return self.put(
+            url,
+            response.text,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified")
+        ).body
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _flush_touches(self):
+        if self._touched:
+            self._db.executemany(
+                "UPDATE responses SET accessed_at = MAX(accessed_at, ?) WHERE source = ? AND key = ?",
+                [(accessed_at, self.source, key) for key, accessed_at in self._touched.items()]
+            )
+            self._touched.clear()
+        self._flushed_at = time.time()
+
+    def _evict(self):
+        self._flush_touches()
+        rows = self._db.execute(
+            "SELECT key, size FROM responses WHERE source = ? ORDER BY accessed_at DESC",
+            (self.source,)
+        ).fetchall()
+        total = 0
+        stale_keys = []
+        for count, (key, size) in enumerate(rows, start=1):
+            total += size
+            if count > self.max_entries or total > self.max_bytes:
+                stale_keys.append((self.source, key))
+                self._memory.pop(key, None)
+        if stale_keys:
+            self._db.executemany("DELETE FROM responses WHERE source = ? AND key = ?", stale_keys)
@@ -0,0 +1,152 @@
+"""Single-payload, client-side paginated result list for the Streamlit pages.
+
+Drawing every result with its own columns and markdown calls costs several
+Streamlit elements per card, so a long result set floods the browser with
+delta messages on every rerun. :func:`render_result_list` instead ships all
+cards as one JSON payload inside a single iframe, where a few lines of
+JavaScript draw one page at a time. A rerun therefore adds exactly one
+element however many results there are.
+
+Cards are plain dicts; every key is optional::
+
+    {"title": ..., "link": ..., "image": ..., "subtitle": ...,
+     "badges": [(css_class, text), ...], "body_label": ..., "body": ...,
+     "action": "View Job"}
+
+Text is inserted with ``textContent`` and links must be http(s), so scraped
+markup can't inject anything into the page.
+"""
+import base64
+import json
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+BASE_CSS = """
+* { box-sizing: border-box; }
+body { margin: 0; font-family: "Source Sans Pro", sans-serif; color: #ffffff; background: transparent; }
+a { text-decoration: none; }
+.card { display: flex; gap: 1.25rem; align-items: flex-start; }
+.card img { width: 25%; max-width: 240px; border-radius: 8px; object-fit: cover; }
+.card .content { flex: 1; min-width: 0; }
+.card h3 { margin: 0 0 0.4rem 0; }
+.card p { margin: 0.3rem 0; }
+.card .badges span { display: inline-block; margin: 0.2rem 0.4rem 0.2rem 0; }
+.card .action { flex: none; align-self: center; }
+.pager { display: flex; gap: 0.75rem; align-items: center; justify-content: center; padding: 0.5rem 0; }
+.pager button { border: none; border-radius: 5px; padding: 0.35rem 1rem; cursor: pointer; }
+.pager button:disabled { opacity: 0.4; cursor: default; }
+"""
+
+_TEMPLATE = """
+<style>{css}</style>
+<div id="results"></div>
+<div class="pager" id="pager">
+  <button id="prev">&#8592; Prev</button><span id="status"></span><button id="next">Next &#8594;</button>
+</div>
+<script>
+const cards = {cards};
+const perPage = {per_page};
+const pages = Math.max(1, Math.ceil(cards.length / perPage));
+let page = 0;
+
+function el(tag, className, text) {{
+  const node = document.createElement(tag);
+  if (className) node.className = className;
+  if (text) node.textContent = text;
+  return node;
+}}
+
+function safeLink(href) {{
+  return /^https?:\\/\\//i.test(href || "") ? href : null;
+}}
+
+function linked(node, href) {{
+  if (!safeLink(href)) return node;
+  const a = el("a");
+  a.href = href;
+  a.target = "_blank";
+  a.rel = "noopener";
+  a.appendChild(node);
+  return a;
+}}
+
+function renderCard(card) {{
+  const root = el("div", "card {card_class}");
+  if (card.image && /^(https?:|data:image\\/)/i.test(card.image)) {{
+    const img = el("img");
+    img.src = card.image;
+    img.loading = "lazy";
+    img.alt = "";
+    root.appendChild(img);
+  }}
+  const content = el("div", "content");
+  const title = el("h3");
+  title.appendChild(card.action ? el("span", "", card.title) : linked(el("span", "", card.title), card.link));
+  content.appendChild(title);
+  if (card.subtitle) content.appendChild(el("p", "subtitle", card.subtitle));
+  if (card.badges && card.badges.length) {{
+    const badges = el("div", "badges");
+    card.badges.forEach(([className, text]) => text && badges.appendChild(el("span", className, text)));
+    content.appendChild(badges);
+  }}
+  if (card.body) {{
+    const body = el("div", "body");
+    if (card.body_label) {{
+      body.appendChild(el("strong", "", card.body_label));
+      body.appendChild(el("br"));
+    }}
+    body.appendChild(document.createTextNode(card.body));
+    content.appendChild(body);
+  }}
+  root.appendChild(content);
+  if (card.action && safeLink(card.link)) {{
+    const action = el("div", "action");
+    action.appendChild(linked(el("div", "action-button", card.action), card.link));
+    root.appendChild(action);
+  }}
+  return root;
+}}
+
+function render() {{
+  const results = document.getElementById("results");
+  results.replaceChildren(...cards.slice(page * perPage, (page + 1) * perPage).map(renderCard));
+  document.getElementById("status").textContent = `Page ${{page + 1}} of ${{pages}} · ${{cards.length}} results`;
+  document.getElementById("prev").disabled = page === 0;
+  document.getElementById("next").disabled = page >= pages - 1;
+  window.scrollTo(0, 0);
+}}
+
+document.getElementById("prev").onclick = () => {{ page = Math.max(0, page - 1); render(); }};
+document.getElementById("next").onclick = () => {{ page = Math.min(pages - 1, page + 1); render(); }};
+document.getElementById("pager").style.display = pages > 1 ? "flex" : "none";
+render();
+</script>
+"""
+
+
+def image_data_uri(data):
+    """Inline image bytes as a ``data:`` URI, sniffing the format from its magic bytes."""
+    if data.startswith(b"RIFF") and data[8:12] == b"WEBP":
+        mime = "image/webp"
+    elif data.startswith(b"\x89PNG"):
+        mime = "image/png"
+    elif data.startswith(b"GIF8"):
+        mime = "image/gif"
+    else:
+        mime = "image/jpeg"
+    return f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+
+
+def render_result_list(cards, css="", card_class="", per_page=10, card_height=160):
+    """Render ``cards`` as one iframe that pages through them ``per_page`` at a time."""
+    # Escape "</" so a card can't close the <script> element early.
+    payload = json.dumps(cards, ensure_ascii=False).replace("</", "<\\/")
+    html = _TEMPLATE.format(css=BASE_CSS + css, cards=payload, per_page=per_page, card_class=card_class)
+    if hasattr(st, "iframe"):
+        # Newer Streamlit sizes the iframe to its content.
+        st.iframe(html, height="content")
+        return
+    shown = min(len(cards), per_page)
+    pager = 56 if len(cards) > per_page else 0
+    components.html(html, height=shown * card_height + pager + 8, scrolling=True)
@@ -0,0 +1,90 @@
+"""Search URLs and result-card layouts for the sites CareerTrack scrapes.
+
+The column names double as the DataFrame headers the Streamlit pages and
+CSV exports use, so changing one here changes the download format too.
+The base URLs can be pointed elsewhere through the environment, which is how
+the benchmarks replay recorded pages from a local stand-in server.
+"""
+import os
+import re
+
+from extraction import CardSpec, Field, extract_cards
+
+COURSERA_BASE_URL = os.environ.get("COURSERA_BASE_URL", "https://www.coursera.org")
+TIMESJOBS_BASE_URL = os.environ.get("TIMESJOBS_BASE_URL", "https://www.timesjobs.com")
+
+
+def coursera_search_url(course_name, page=1):
+    """Search URL for ``course_name``; ``page`` is 1-based."""
+    search_terms = '%20'.join(course_name.split())
+    return coursera_page_url(f"{COURSERA_BASE_URL}/search?query={search_terms}", page)
+
+
+def coursera_page_url(url, page):
+    """URL of result page ``page`` for a page-1 Coursera search URL."""
+    return url if page == 1 else f"{url}&page={page}"
+
+
+def timesjobs_search_url(job_name, page=1, location=""):
+    """Search URL for ``job_name`` in ``location`` (anywhere if empty); ``page`` is 1-based."""
+    job_name_title = job_name.title()
+    keywords = '+'.join(job_name.split())
+    location = '+'.join(location.split())
+    url = (f'{TIMESJOBS_BASE_URL}/candidate/job-search.html?searchType=personalizedSearch&from=submit'
+           f'&searchTextSrc=&searchTextText="{job_name_title}"&txtKeywords={keywords}&txtLocation={location}')
+    return timesjobs_page_url(url, page)
+
+
+def timesjobs_page_url(url, page):
+    """URL of result page ``page`` for a page-1 TimesJobs search URL."""
+    return url if page == 1 else f"{url}&sequence={page}&startPage=1"
+
+
+def _first_word(text):
+    words = text.split()
+    return words[0] if words else ""
+
+
+def _collapse_whitespace(text):
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def _job_description(text):
+    # The block also holds the key skills; keep only the free-text summary.
+    text = _collapse_whitespace(text.split("KeySkills:")[0])
+    text = text.removeprefix("Job Description:").strip()
+    return re.sub(r"(More details\.\.\.\s*)?More Details$", "", text).strip()
+
+
+def _absolute_coursera_link(href):
+    return href if href.startswith("http") else COURSERA_BASE_URL + href
+
+
+COURSERA_CARD = CardSpec("div", "cds-ProductCard-gridCard", [
+    Field("Course Title", "h3", "cds-CommonCard-title"),
+    Field("Educator", "p", "cds-ProductCard-partnerNames"),
+    Field("Skills", "div", "cds-CommonCard-bodyContent"),
+    Field("Rating", "div", "cds-RatingStat-meter", clean=lambda text: text.split("Rating")[0].strip()),
+    Field("Link", "a", "cds-CommonCard-titleLink", attr="href", clean=_absolute_coursera_link),
+    Field("Level", "div", "cds-CommonCard-metadata", clean=_first_word),
+    Field("Images Link", "img", attr="src"),
+])
+
+TIMESJOBS_CARD = CardSpec("li", "job-bx", [
+    Field("Job Title", "h2", "heading-trun", attr="title"),
+    Field("Company Name", "h3", "joblist-comp-name", clean=_collapse_whitespace),
+    Field("Link", "a", "posoverlay_srp", attr="href"),
+    Field("Posted", "span", "sim-posted", clean=_collapse_whitespace),
+    Field("Key Skills", "span", "srp-skills", clean=_collapse_whitespace),
+    Field("Description", "ul", "list-job-dtl", clean=_job_description),
+])
+
+
+def parse_courses(html, limit=5):
+    """Return up to ``limit`` course records from a Coursera search page."""
+    return extract_cards(html, COURSERA_CARD, limit)
+
+
+def parse_jobs(html, limit=5):
+    """Return up to ``limit`` job records from a TimesJobs search page."""
+    return extract_cards(html, TIMESJOBS_CARD, limit)